@@ -24,14 +24,24 @@ string to create pages at space root level.
 
 The tests verify that all CRUD operations work correctly with the v1 REST API
 used by Confluence Data Center and Server editions.
+
+Test methods are independent of one another: each touches a distinct aspect (labels, properties,
+attachments) of the shared fixture page or works on a page of its own, and the underlying `requests.Session` keeps a
+connection pool large enough for concurrent use. As such, the methods may be run in parallel by a
+thread-based test runner that honors class fixtures, which reduces wall-clock time to that of the
+slowest test.
 """
 
+import contextlib
+import functools
 import logging
 import os
 import unittest
 from typing import Optional
 
-from md2conf.api import ConfluenceAPI, ConfluenceSession, ConfluenceVersion
+import requests
+
+from md2conf.api import ConfluenceAPI, ConfluenceContentProperty, ConfluenceLabel, ConfluencePage, ConfluenceSession, ConfluenceVersion
 from md2conf.environment import ConfluenceConnectionProperties
 from tests.utility import TypedTestCase
 
@@ -41,6 +51,7 @@ logging.basicConfig(
 )
 
 
+@functools.lru_cache(maxsize=1)
 def get_datacenter_connection() -> Optional[ConfluenceConnectionProperties]:
     """
     Get Data Center connection properties from environment variables.
@@ -72,17 +83,34 @@ def get_datacenter_connection() -> Optional[ConfluenceConnectionProperties]:
     )
 
 
+@unittest.skipUnless(
+    get_datacenter_connection() is not None, "Data Center integration tests require connection environment variables (CONFLUENCE_DOMAIN, etc.)"
+)
+class TestDataCenterAPIVersion(TypedTestCase):
+    """Checks API version selection, which needs an open session but no space or page fixtures."""
+
+    def test_version_detection(self) -> None:
+        """Verify that deployment_type=datacenter forces v1 API usage."""
+        props = get_datacenter_connection()
+        assert props is not None, "Data Center connection properties not available"
+
+        with ConfluenceAPI(props) as session:
+            self.assertEqual(session.api_version, ConfluenceVersion.VERSION_1)
+
+
 @unittest.skipUnless(
     get_datacenter_connection() is not None, "Data Center integration tests require connection environment variables (CONFLUENCE_DOMAIN, etc.)"
 )
 class TestDataCenterAPI(TypedTestCase):
     """Test suite for Confluence Data Center REST API v1 operations."""
 
+    exit_stack: contextlib.ExitStack
     api: ConfluenceAPI
     session: ConfluenceSession
     space_key: str
     space_id: str
     test_root_page_id: str
+    shared_page: ConfluencePage
 
     # Prefix for all test pages to avoid collisions
     # Using simple alphanumeric + hyphen to avoid URL slug issues
@@ -94,36 +122,45 @@ class TestDataCenterAPI(TypedTestCase):
         props = get_datacenter_connection()
         assert props is not None, "Data Center connection properties not available"
 
+        # Resources are released in reverse order of acquisition, even if class setup fails midway
+        cls.exit_stack = contextlib.ExitStack()
         cls.api = ConfluenceAPI(props)
-        cls.session = cls.api.__enter__()  # Open the session
+        cls.session = cls.exit_stack.enter_context(cls.api)  # Open the session
+
+        try:
+            # Assert space_key is not None (validated in get_datacenter_connection)
+            assert props.space_key is not None, "Space key must be set for Data Center tests"
+            cls.space_key = props.space_key
 
-        # Assert space_key is not None (validated in get_datacenter_connection)
-        assert props.space_key is not None, "Space key must be set for Data Center tests"
-        cls.space_key = props.space_key
+            # Get space ID from space key
+            cls.space_id = cls.session.space_key_to_id(cls.space_key)
 
-        # Get space ID from space key
-        cls.space_id = cls.session.space_key_to_id(cls.space_key)
+            # Get test root page ID with default value
+            cls.test_root_page_id = os.getenv("CONFLUENCE_TEST_ROOT_PAGE_ID", "293077930")
 
-        # Get test root page ID with default value
-        cls.test_root_page_id = os.getenv("CONFLUENCE_TEST_ROOT_PAGE_ID", "293077930")
+            # Verify we're actually using v1 API
+            assert cls.session.api_version == ConfluenceVersion.VERSION_1, f"Expected VERSION_1 but got {cls.session.api_version}"
 
-        # Verify we're actually using v1 API
-        assert cls.session.api_version == ConfluenceVersion.VERSION_1, f"Expected VERSION_1 but got {cls.session.api_version}"
+            # Scratch page shared by tests that operate on an existing page; removed in `tearDownClass`
+            cls.shared_page = cls.session.create_page(
+                parent_id=cls.test_root_page_id,
+                title=f"{cls.TEST_PREFIX} Shared Fixture",
+                new_content="<p>Page shared by Data Center integration tests</p>",
+            )
+            cls.exit_stack.callback(cls.session.delete_page, cls.shared_page.id)
+        except BaseException:
+            cls.exit_stack.close()
+            raise
 
         logging.info(f"Data Center tests initialized with space: {cls.space_key} (ID: {cls.space_id}), test root page: {cls.test_root_page_id}")
 
     @classmethod
     def tearDownClass(cls) -> None:
-        """Close the Confluence session after all tests."""
-        if hasattr(cls, "api"):
-            cls.api.__exit__(None, None, None)
+        """Delete the shared page and close the Confluence session after all tests."""
+        cls.exit_stack.close()
 
     def test_direct_api_call(self) -> None:
         """Test direct API call without using any md2conf code."""
-        import os
-
-        import requests
-
         url = "https://confluence.grantsolutions.gov/rest/api/content"
         headers = {"Authorization": f"Bearer {os.getenv('CONFLUENCE_API_KEY')}"}
         payload = {
@@ -141,19 +178,13 @@ class TestDataCenterAPI(TypedTestCase):
         page_id = response.json()["id"]
         requests.delete(f"https://confluence.grantsolutions.gov/rest/api/content/{page_id}", headers=headers)
 
-    def test_version_detection(self) -> None:
-        """Verify that deployment_type=datacenter forces v1 API usage."""
-        self.assertEqual(self.session.api_version, ConfluenceVersion.VERSION_1)
-
     def test_space_operations(self) -> None:
         """Test space lookup operations with v1 API."""
-        # Test space_key_to_id
-        space_id = self.session.space_key_to_id(self.space_key)
-        self.assertIsNotNone(space_id)
-        self.assertIsInstance(space_id, str)
+        # `space_key_to_id` has already been invoked in `setUpClass`
+        self.assertIsInstance(self.space_id, str)
 
         # Test space_id_to_key
-        retrieved_key = self.session.space_id_to_key(space_id)
+        retrieved_key = self.session.space_id_to_key(self.space_id)
         self.assertEqual(retrieved_key, self.space_key)
 
     def test_page_creation_and_deletion(self) -> None:
@@ -174,139 +205,99 @@ class TestDataCenterAPI(TypedTestCase):
 
     def test_page_update(self) -> None:
         """Test updating a page using v1 API."""
-        # Create a test page under test root page
+        # Update a page of its own, as the version and title of the shared page must not change under other tests
         title = f"{self.TEST_PREFIX} Page Update"
         created_page = self.session.create_page(
             parent_id=self.test_root_page_id,
             title=title,
             new_content="<p>Original content</p>",
         )
+        page_id = created_page.id
 
         try:
-            # Update the page (version must be incremented)
+            # Update the page (version must be incremented); the created page carries its version
+            new_version = created_page.version.number + 1
             updated_title = f"{title} - Updated"
-            self.session.update_page(
-                page_id=created_page.id,
+            updated_page = self.session.update_page(
+                page_id=page_id,
                 content="<p>Updated content</p>",
                 title=updated_title,
-                version=created_page.version.number + 1,
+                version=new_version,
             )
 
-            # Verify update
-            updated_page = self.session.get_page_properties(created_page.id)
+            # Verify update with the page returned by the update operation
             self.assertEqual(updated_page.title, updated_title)
+            self.assertEqual(updated_page.version.number, new_version)
         finally:
-            # Clean up
-            self.session.delete_page(created_page.id)
+            self.session.delete_page(page_id)
 
     def test_attachment_operations(self) -> None:
         """Test attachment upload and retrieval using v1 API."""
-        import tempfile
-        from pathlib import Path
+        page_id = self.shared_page.id
+        attachment_name = "datacenter-test-attachment.txt"
 
-        # Create a test page under test root page
-        created_page = self.session.create_page(
-            parent_id=self.test_root_page_id,
-            title=f"{self.TEST_PREFIX} Attachments",
-            new_content="<p>Page for testing attachments</p>",
-        )
+        # Upload attachment from memory
+        self.session.upload_attachment(page_id, attachment_name, raw_data=b"Test attachment content")
 
-        try:
-            # Create a temporary file to upload
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as temp_file:
-                temp_file.write("Test attachment content")
-                temp_path = Path(temp_file.name)
-
-            try:
-                # Upload attachment
-                self.session.upload_attachment(created_page.id, temp_path.name, attachment_path=temp_path)
-
-                # Retrieve attachment by name to verify upload
-                attachment = self.session.get_attachment_by_name(created_page.id, temp_path.name)
-                self.assertIsNotNone(attachment)
-                self.assertEqual(attachment.title, temp_path.name)
-            finally:
-                # Clean up temp file
-                temp_path.unlink()
-        finally:
-            # Clean up page
-            self.session.delete_page(created_page.id)
+        # Retrieve attachment by name to verify upload
+        attachment = self.session.get_attachment_by_name(page_id, attachment_name)
+        self.assertIsNotNone(attachment)
+        self.assertEqual(attachment.title, attachment_name)
 
     def test_label_operations(self) -> None:
         """Test adding, retrieving, and removing labels using v1 API."""
-        from md2conf.api import ConfluenceLabel
+        page_id = self.shared_page.id
 
-        # Create a test page under test root page
-        created_page = self.session.create_page(
-            parent_id=self.test_root_page_id,
-            title=f"{self.TEST_PREFIX} Labels",
-            new_content="<p>Page for testing labels</p>",
-        )
+        # Add labels
+        label1 = ConfluenceLabel(name="datacenter-test", prefix="global")
+        label2 = ConfluenceLabel(name="integration-test", prefix="global")
 
-        try:
-            # Add labels
-            label1 = ConfluenceLabel(name="datacenter-test", prefix="global")
-            label2 = ConfluenceLabel(name="integration-test", prefix="global")
-
-            self.session.add_labels(created_page.id, [label1, label2])
-
-            # Retrieve labels to verify addition
-            labels = self.session.get_labels(created_page.id)
-            label_names = [label.name for label in labels]
-            self.assertIn("datacenter-test", label_names)
-            self.assertIn("integration-test", label_names)
-
-            # Remove a label
-            self.session.remove_labels(created_page.id, [label1])
-
-            # Verify removal
-            updated_labels = self.session.get_labels(created_page.id)
-            updated_label_names = [label.name for label in updated_labels]
-            self.assertNotIn("datacenter-test", updated_label_names)
-            self.assertIn("integration-test", updated_label_names)
-        finally:
-            # Clean up
-            self.session.delete_page(created_page.id)
+        # A single POST adds all labels; the v1 REST API has no batch endpoint for the other calls
+        self.session.add_labels(page_id, [label1, label2])
 
-    def test_content_property_operations(self) -> None:
-        """Test content property CRUD operations using v1 API."""
-        from md2conf.api import ConfluenceContentProperty
+        # Retrieve labels to verify addition
+        labels = self.session.get_labels(page_id)
+        label_names = [label.name for label in labels]
+        self.assertIn("datacenter-test", label_names)
+        self.assertIn("integration-test", label_names)
 
-        # Create a test page under test root page
-        created_page = self.session.create_page(
-            parent_id=self.test_root_page_id,
-            title=f"{self.TEST_PREFIX} Content Properties",
-            new_content="<p>Page for testing content properties</p>",
-        )
+        # Remove a label
+        self.session.remove_labels(page_id, [label1])
 
-        try:
-            # Add property
-            prop = ConfluenceContentProperty(key="test-property", value={"data": "test value", "number": 42})
-            added_prop = self.session.add_content_property_to_page(created_page.id, prop)
-            self.assertEqual(added_prop.key, "test-property")
-            self.assertEqual(added_prop.value["data"], "test value")  # type: ignore
-
-            # Get properties
-            properties = self.session.get_content_properties_for_page(created_page.id)
-            prop_keys = [p.key for p in properties]
-            self.assertIn("test-property", prop_keys)
-
-            # Update property (version must be incremented)
-            updated_property_data = ConfluenceContentProperty(key="test-property", value={"data": "updated value", "number": 100})
-            updated_prop = self.session.update_content_property_for_page(created_page.id, added_prop.id, added_prop.version.number + 1, updated_property_data)
-            self.assertEqual(updated_prop.value["data"], "updated value")  # type: ignore
-            self.assertEqual(updated_prop.value["number"], 100)  # type: ignore
-
-            # Remove property
-            self.session.remove_content_property_from_page(created_page.id, added_prop.id)
-
-            # Verify removal
-            updated_properties = self.session.get_content_properties_for_page(created_page.id)
-            updated_prop_keys = [p.key for p in updated_properties]
-            self.assertNotIn("test-property", updated_prop_keys)
-        finally:
-            # Clean up
-            self.session.delete_page(created_page.id)
+        # Verify removal
+        updated_labels = self.session.get_labels(page_id)
+        updated_label_names = [label.name for label in updated_labels]
+        self.assertNotIn("datacenter-test", updated_label_names)
+        self.assertIn("integration-test", updated_label_names)
+
+    def test_content_property_operations(self) -> None:
+        """Test content property CRUD operations using v1 API."""
+        page_id = self.shared_page.id
+
+        # Add property
+        prop = ConfluenceContentProperty(key="test-property", value={"data": "test value", "number": 42})
+        added_prop = self.session.add_content_property_to_page(page_id, prop)
+        self.assertEqual(added_prop.key, "test-property")
+        self.assertEqual(added_prop.value["data"], "test value")  # type: ignore
+
+        # Get properties
+        properties = self.session.get_content_properties_for_page(page_id)
+        prop_keys = [p.key for p in properties]
+        self.assertIn("test-property", prop_keys)
+
+        # Update property (version must be incremented)
+        updated_property_data = ConfluenceContentProperty(key="test-property", value={"data": "updated value", "number": 100})
+        updated_prop = self.session.update_content_property_for_page(page_id, added_prop.id, added_prop.version.number + 1, updated_property_data)
+        self.assertEqual(updated_prop.value["data"], "updated value")  # type: ignore
+        self.assertEqual(updated_prop.value["number"], 100)  # type: ignore
+
+        # Remove property
+        self.session.remove_content_property_from_page(page_id, added_prop.id)
+
+        # Verify removal
+        updated_properties = self.session.get_content_properties_for_page(page_id)
+        updated_prop_keys = [p.key for p in updated_properties]
+        self.assertNotIn("test-property", updated_prop_keys)
 
 
 if __name__ == "__main__":
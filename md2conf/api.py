@@ -6,29 +6,36 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import concurrent.futures
 import datetime
+import email.utils
 import enum
-import io
+import functools
+import json
 import logging
 import mimetypes
+import operator
 import random
 import ssl
+import stat
 import sys
 import time
 import typing
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePath
 from types import TracebackType
-from typing import Any, Callable, Optional, TypeVar, overload
+from typing import Any, Callable, Iterator, Optional, TypeVar, overload
 from urllib.parse import urlencode, urlparse, urlunparse
 
 import requests
 from requests.adapters import HTTPAdapter
 from strong_typing.core import JsonType
-from strong_typing.serialization import DeserializerOptions, json_dump_string, json_to_object, object_to_json
+from strong_typing.deserializer import Deserializer, create_deserializer
+from strong_typing.serialization import DeserializerOptions, object_to_json
+from urllib3.util.retry import Retry
 
 from .environment import ArgumentError, ConfluenceConnectionProperties, ConfluenceError, PageCollisionError, PageError
-from .extra import override
+from .extra import DATACLASS_SLOTS, override
 from .metadata import ConfluenceSiteMetadata
 
 if sys.version_info >= (3, 10):
@@ -38,6 +45,12 @@ else:
 
 T = TypeVar("T")
 
+JsonObject = dict[str, JsonType]
+"A JSON object. Aliased at module level so that casts and type arguments do not build a new generic alias on each call."
+
+JsonArray = list[JsonType]
+"A JSON array."
+
 mimetypes.add_type("application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx", strict=True)
 mimetypes.add_type("text/vnd.mermaid", ".mmd", strict=True)
 mimetypes.add_type("application/vnd.oasis.opendocument.presentation", ".odp", strict=True)
@@ -47,15 +60,70 @@ mimetypes.add_type("application/vnd.openxmlformats-officedocument.presentationml
 mimetypes.add_type("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx", strict=True)
 
 
+_DESERIALIZERS: dict[Any, Deserializer[Any]] = {}
+"Parser engines by target type, built once. The library caches engines for plain classes only, not for generic aliases such as `list[T]`."
+
+
+_DESERIALIZER_OPTIONS = DeserializerOptions(skip_unassigned=True)
+"Options for building parser engines; properties in REST API responses with no matching field are ignored."
+
+
+_JSON_CONTAINERS: dict[Any, type] = {JsonObject: dict, JsonArray: list}
+"Target types that JSON data already conforms to, mapped to the container type to check against."
+
+
 def _json_to_object(
     typ: type[T],
     data: JsonType,
 ) -> T:
-    return json_to_object(typ, data, options=DeserializerOptions(skip_unassigned=True))
+    # responses parsed by `json` need no conversion into raw JSON types; a deserializer would only make a validated deep copy
+    container = _JSON_CONTAINERS.get(typ)
+    if container is not None and isinstance(data, container):
+        return typing.cast(T, data)
 
+    deserializer = _DESERIALIZERS.get(typ)
+    if deserializer is None:
+        deserializer = create_deserializer(typ, sys.modules[__name__], options=_DESERIALIZER_OPTIONS)
+        _DESERIALIZERS[typ] = deserializer
+    return typing.cast(T, deserializer.parse(data))
 
-def build_url(base_url: str, query: Optional[dict[str, str]] = None) -> str:
-    "Builds a URL with scheme, host, port, path and query string parameters."
+
+_ACCEPT_JSON: dict[str, str] = {"Accept": "application/json"}
+"Headers for requests with a JSON response. Header mappings are shared across requests; `requests` merges them into a new mapping without modifying them."
+
+_SEND_JSON: dict[str, str] = {"Content-Type": "application/json"}
+"Headers for requests with a JSON body."
+
+_SEND_RECEIVE_JSON: dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
+"Headers for requests with a JSON body and a JSON response."
+
+_UPLOAD_HEADERS: dict[str, str] = {"X-Atlassian-Token": "no-check", "Accept": "application/json"}
+"Headers for multipart attachment uploads, which Confluence accepts only with XSRF checks disabled."
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+"Compact JSON encoder for request bodies, created once; `json.dumps` with non-default options creates a new encoder on each call."
+
+
+def _json_dump(data: JsonType) -> bytes:
+    """
+    Serializes JSON data into a compact UTF-8 JSON request body.
+
+    Unlike passing `json=...` to `requests`, non-ASCII characters (e.g. in page content) are not escaped, which would
+    make the body up to six times as long.
+    """
+
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def _json_encode(body: Any) -> bytes:
+    "Serializes an object into a compact UTF-8 JSON request body."
+
+    return _json_dump(object_to_json(body))
+
+
+def _parse_base_url(base_url: str) -> tuple[str, str, str]:
+    "Splits a URL into scheme, network location and path, ensuring it has no parameters, query string or fragment."
 
     scheme, netloc, path, params, query_str, fragment = urlparse(base_url)
 
@@ -66,6 +134,13 @@ def build_url(base_url: str, query: Optional[dict[str, str]] = None) -> str:
     if fragment:
         raise ValueError("expected: url with no fragment")
 
+    return scheme, netloc, path
+
+
+def build_url(base_url: str, query: Optional[dict[str, str]] = None) -> str:
+    "Builds a URL with scheme, host, port, path and query string parameters."
+
+    scheme, netloc, path = _parse_base_url(base_url)
     url_parts = (scheme, netloc, path, None, urlencode(query) if query else None, None)
     return urlunparse(url_parts)
 
@@ -75,6 +150,72 @@ LOGGER = logging.getLogger(__name__)
 ANCESTOR_DEPTH_LIMIT = 100
 "Maximum page hierarchy depth traversed when resolving ancestors; a stop against cyclic parent data."
 
+POOL_CONNECTIONS = 10
+"Number of per-host connection pools cached by the HTTPS transport adapter."
+
+POOL_MAXSIZE = 20
+"Maximum number of keep-alive connections retained per host, reused across all requests of a session."
+
+CONNECT_RETRIES = 3
+"Number of times the transport re-attempts to establish a connection (e.g. on a transient DNS or TCP failure)."
+
+MAX_RETRY_AFTER = 60.0
+"Upper bound (in seconds) on the delay honored from a `Retry-After` header, so that a misbehaving server cannot stall a run."
+
+CONCURRENT_REQUESTS = 8
+"Maximum number of independent requests (e.g. attachment uploads) issued concurrently; kept below `POOL_MAXSIZE` so requests do not wait for a connection."
+
+
+def _invoke(action: Callable[[], None]) -> None:
+    "Calls a function that takes no arguments."
+
+    action()
+
+
+def _for_each_concurrently(func: Callable[[T], None], items: list[T]) -> None:
+    """
+    Invokes a function on each item, running calls on a thread pool when there is more than one item.
+
+    :param func: Function that makes one or more independent requests.
+    :param items: Items to pass to the function.
+    :raises Exception: The exception raised by the first failing call in item order, once all calls have completed.
+    """
+
+    if len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(CONCURRENT_REQUESTS, len(items))) as executor:
+        # consume results to propagate exceptions
+        for _ in executor.map(func, items):
+            pass
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Extracts the delay requested by the server with the `Retry-After` header, if any.
+
+    :param response: The HTTP response.
+    :returns: Delay in seconds (at most `MAX_RETRY_AFTER`), or `None` if the header is absent or malformed.
+    """
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        delay = (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+
+    return min(max(0.0, delay), MAX_RETRY_AFTER)
+
 
 def _retry_request(
     func: Callable[..., requests.Response],
@@ -86,7 +227,8 @@ def _retry_request(
     """Execute an HTTP request with retry and exponential backoff with jitter.
 
     Retries on HTTP 429 (rate limit) and 5xx (server error) status codes.
-    Uses exponential backoff with random jitter to avoid thundering herd.
+    Uses exponential backoff with random jitter to avoid thundering herd, unless the server specifies a delay with the
+    `Retry-After` header.
 
     :param func: The request function to call (e.g. session.get, session.post).
     :param max_retries: Maximum number of retry attempts (default 3).
@@ -98,7 +240,9 @@ def _retry_request(
         response = func(*args, **kwargs)
         if response.status_code == 429 or response.status_code >= 500:
             if attempt < max_retries:
-                delay = base_delay * (2**attempt) + random.uniform(0, 1)
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = base_delay * (2**attempt) + random.uniform(0, 1)
                 LOGGER.warning(
                     "Request failed with status %d, retrying in %.1fs (attempt %d/%d)",
                     response.status_code,
@@ -112,6 +256,18 @@ def _retry_request(
     return response
 
 
+def _check_response(response: requests.Response) -> None:
+    """
+    Logs the payload of a response (when debug logging is enabled) and raises an exception for error status codes.
+
+    The body is decoded for logging only if the message would be emitted.
+    """
+
+    if LOGGER.isEnabledFor(logging.DEBUG) and response.text:
+        LOGGER.debug("Received HTTP payload:\n%s", response.text)
+    response.raise_for_status()
+
+
 @overload
 def response_cast(response_type: None, response: requests.Response) -> None: ...
 
@@ -123,9 +279,7 @@ def response_cast(response_type: type[T], response: requests.Response) -> T: ...
 def response_cast(response_type: Optional[type[T]], response: requests.Response) -> Optional[T]:
     "Converts a response body into the expected type."
 
-    if response.text:
-        LOGGER.debug("Received HTTP payload:\n%s", response.text)
-    response.raise_for_status()
+    _check_response(response)
     if response_type is None:
         return None
     else:
@@ -180,19 +334,19 @@ class ConfluenceLegacyType(enum.Enum):
     ATTACHMENT = "attachment"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceLinks:
     next: str
     base: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceResultSet:
     results: list[JsonType]
     _links: ConfluenceLinks
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceContentVersion:
     number: int
     minorEdit: bool = False
@@ -201,7 +355,7 @@ class ConfluenceContentVersion:
     authorId: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceAttachment:
     """
     Holds data for an object uploaded to Confluence as a page attachment.
@@ -236,7 +390,24 @@ class ConfluenceAttachment:
     version: ConfluenceContentVersion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ConfluenceAttachmentUpload:
+    """
+    Holds data for an object to upload to Confluence as a page attachment.
+
+    :param name: Unprefixed name unique to the page.
+    :param attachment_path: Path to the file to upload as an attachment.
+    :param raw_data: Raw data to upload as an attachment.
+    :param comment: Attachment description.
+    """
+
+    name: str
+    attachment_path: Optional[Path] = None
+    raw_data: Optional[bytes] = None
+    comment: Optional[str] = None
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluencePageProperties:
     """
     Holds Confluence page properties used for page synchronization.
@@ -269,7 +440,7 @@ class ConfluencePageProperties:
     version: ConfluenceContentVersion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluencePageStorage:
     """
     Holds Confluence page content.
@@ -282,7 +453,7 @@ class ConfluencePageStorage:
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluencePageBody:
     """
     Holds Confluence page content.
@@ -293,7 +464,7 @@ class ConfluencePageBody:
     storage: ConfluencePageStorage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluencePage(ConfluencePageProperties):
     """
     Holds Confluence page data used for page synchronization.
@@ -308,7 +479,7 @@ class ConfluencePage(ConfluencePageProperties):
         return self.body.storage.value
 
 
-@dataclass(frozen=True, eq=True, order=True)
+@dataclass(frozen=True, eq=True, order=True, **DATACLASS_SLOTS)
 class ConfluenceLabel:
     """
     Holds information about a single label.
@@ -321,7 +492,7 @@ class ConfluenceLabel:
     prefix: str
 
 
-@dataclass(frozen=True, eq=True, order=True)
+@dataclass(frozen=True, eq=True, order=True, **DATACLASS_SLOTS)
 class ConfluenceIdentifiedLabel(ConfluenceLabel):
     """
     Holds information about a single label.
@@ -332,7 +503,7 @@ class ConfluenceIdentifiedLabel(ConfluenceLabel):
     id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceContentProperty:
     """
     Represents a content property.
@@ -345,7 +516,7 @@ class ConfluenceContentProperty:
     value: JsonType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceVersionedContentProperty(ConfluenceContentProperty):
     """
     Represents a content property.
@@ -356,7 +527,7 @@ class ConfluenceVersionedContentProperty(ConfluenceContentProperty):
     version: ConfluenceContentVersion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceIdentifiedContentProperty(ConfluenceVersionedContentProperty):
     """
     Represents a content property.
@@ -367,7 +538,7 @@ class ConfluenceIdentifiedContentProperty(ConfluenceVersionedContentProperty):
     id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceCreatePageRequest:
     spaceId: str
     status: Optional[ConfluenceStatus]
@@ -376,7 +547,7 @@ class ConfluenceCreatePageRequest:
     body: ConfluencePageBody
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceUpdatePageRequest:
     id: str
     status: ConfluenceStatus
@@ -385,7 +556,7 @@ class ConfluenceUpdatePageRequest:
     version: ConfluenceContentVersion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceUpdateAttachmentRequest:
     id: str
     type: ConfluenceLegacyType
@@ -394,7 +565,7 @@ class ConfluenceUpdateAttachmentRequest:
     version: ConfluenceContentVersion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConfluenceUser:
     """
     Represents a Confluence user resolved for a mention.
@@ -410,6 +581,36 @@ class ConfluenceUser:
     csf_value: str
 
 
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(suffixes: str) -> str:
+    """
+    Guesses the MIME type of a file based on its extension(s), e.g. `.png` or `.tar.gz`.
+
+    Results are cached because many attachments share the same few extensions.
+    """
+
+    content_type, _ = mimetypes.guess_type(f"attachment{suffixes}", strict=True)
+    return content_type or "application/octet-stream"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Returns the SSL context shared by all HTTPS connections.
+
+    The context is created once per process because loading the system trust store is costly. Sharing is safe because the context
+    is not modified after creation.
+    """
+
+    if sys.version_info >= (3, 10):
+        ctx = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    else:
+        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH, cafile=certifi.where())
+    ctx.check_hostname = True
+    ctx.verify_mode = ssl.CERT_REQUIRED
+    return ctx
+
+
 class TruststoreAdapter(HTTPAdapter):
     """
     Provides a general-case interface for HTTPS sessions to connect to HTTPS URLs.
@@ -425,13 +626,7 @@ class TruststoreAdapter(HTTPAdapter):
         Adapts the pool manager to use the provided SSL context instead of the default.
         """
 
-        if sys.version_info >= (3, 10):
-            ctx = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        else:
-            ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH, cafile=certifi.where())
-        ctx.check_hostname = True
-        ctx.verify_mode = ssl.CERT_REQUIRED
-        super().init_poolmanager(connections, maxsize, block, ssl_context=ctx, **pool_kwargs)  # type: ignore[no-untyped-call]
+        super().init_poolmanager(connections, maxsize, block, ssl_context=_get_ssl_context(), **pool_kwargs)  # type: ignore[no-untyped-call]
 
 
 class ConfluenceAPI:
@@ -451,7 +646,10 @@ class ConfluenceAPI:
         """
 
         session = requests.Session()
-        session.mount("https://", TruststoreAdapter())
+        # connection errors are retried by the transport (no request has been sent, so this is safe for any method);
+        # HTTP status codes are retried in `_retry_request`
+        retries = Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, status=0, backoff_factor=0.3)
+        session.mount("https://", TruststoreAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retries))
 
         if self.properties.user_name:
             session.auth = (self.properties.user_name, self.properties.api_key)
@@ -486,18 +684,24 @@ class ConfluenceAPI:
             self.session = None
 
 
+_property_key = operator.attrgetter("key")
+"Extracts the key of a content property; used when indexing properties by key."
+
+
 class ConfluenceSession:
     """
     Represents an active connection to a Confluence server.
     """
 
     session: requests.Session
-    api_url: str
     api_version: ConfluenceVersion
     site: ConfluenceSiteMetadata
 
+    _api_url: str
+    _api_prefixes: dict[ConfluenceVersion, str]
     _space_id_to_key: dict[str, str]
     _space_key_to_id: dict[str, str]
+    _property_id_to_key: dict[str, str]
 
     def __init__(
         self,
@@ -512,6 +716,7 @@ class ConfluenceSession:
         self.session = session
         self._space_id_to_key = {}
         self._space_key_to_id = {}
+        self._property_id_to_key = {}
 
         # Detect and set API version based on deployment type
         self.api_version = self._detect_api_version(properties.deployment_type)
@@ -522,13 +727,13 @@ class ConfluenceSession:
 
             if not domain or not base_path:
                 # Use detected API version for domain/base_path inference
-                if self.api_version == ConfluenceVersion.VERSION_1:
+                if self.api_version is ConfluenceVersion.VERSION_1:
                     # v1 API: GET /rest/api/space?limit=1
-                    data = self._get(ConfluenceVersion.VERSION_1, "/space", dict[str, JsonType], query={"limit": "1"})
-                    results = typing.cast(list[JsonType], data.get("results", []))
+                    data = self._get(ConfluenceVersion.VERSION_1, "/space", JsonObject, query={"limit": "1"})
+                    results = typing.cast(JsonArray, data.get("results", []))
                     if results:
-                        result = typing.cast(dict[str, JsonType], results[0])
-                        links = typing.cast(dict[str, JsonType], result.get("_links", {}))
+                        result = typing.cast(JsonObject, results[0])
+                        links = typing.cast(JsonObject, result.get("_links", {}))
                         base_url = typing.cast(str, links.get("base", ""))
                     else:
                         raise ConfluenceError("Unable to infer domain and base path: no spaces found")
@@ -551,27 +756,23 @@ class ConfluenceSession:
             LOGGER.info("Discovering Confluence REST API URL")
 
             # For Data Center/Server (v1 API), always use classic REST API URL
-            if self.api_version == ConfluenceVersion.VERSION_1:
+            if self.api_version is ConfluenceVersion.VERSION_1:
                 self.api_url = f"https://{self.site.domain}{self.site.base_path}"
                 LOGGER.info("Configured classic Confluence REST API URL for Data Center/Server: %s", self.api_url)
             else:
                 # For Cloud (v2 API), try scoped API URL first, then fall back to classic
                 try:
                     # obtain cloud ID to build URL for access with scoped token
-                    response = _retry_request(self.session.get,f"https://{self.site.domain}/_edge/tenant_info", headers={"Accept": "application/json"}, verify=True)
-                    if response.text:
-                        LOGGER.debug("Received HTTP payload:\n%s", response.text)
-                    response.raise_for_status()
+                    response = _retry_request(self.session.get,f"https://{self.site.domain}/_edge/tenant_info", headers=_ACCEPT_JSON, verify=True)
+                    _check_response(response)
                     cloud_id = response.json()["cloudId"]
 
                     # try next-generation REST API URL
                     LOGGER.info("Probing scoped Confluence REST API URL")
                     self.api_url = f"https://api.atlassian.com/ex/confluence/{cloud_id}/"
                     url = self._build_url(ConfluenceVersion.VERSION_2, "/spaces", {"limit": "1"})
-                    response = _retry_request(self.session.get,url, headers={"Accept": "application/json"}, verify=True)
-                    if response.text:
-                        LOGGER.debug("Received HTTP payload:\n%s", response.text)
-                    response.raise_for_status()
+                    response = _retry_request(self.session.get,url, headers=_ACCEPT_JSON, verify=True)
+                    _check_response(response)
 
                     LOGGER.info("Configured scoped Confluence REST API URL: %s", self.api_url)
                 except requests.exceptions.HTTPError:
@@ -579,6 +780,20 @@ class ConfluenceSession:
                     self.api_url = f"https://{self.site.domain}{self.site.base_path}"
                     LOGGER.info("Configured classic Confluence REST API URL: %s", self.api_url)
 
+    @property
+    def api_url(self) -> str:
+        "Base URL for invoking the Confluence REST API, with a trailing slash."
+
+        return self._api_url
+
+    @api_url.setter
+    def api_url(self, url: str) -> None:
+        _parse_base_url(url)
+        self._api_url = url
+
+        # URL prefixes are fixed for the lifetime of the session; avoid rebuilding them on each request
+        self._api_prefixes = {version: f"{url}{version.value}" for version in ConfluenceVersion}
+
     def close(self) -> None:
         self.session.close()
         self.session = requests.Session()
@@ -621,8 +836,11 @@ class ConfluenceSession:
         :returns: A full URL.
         """
 
-        base_url = f"{self.api_url}{version.value}{path}"
-        return build_url(base_url, query)
+        # the base URL is validated when set, and paths are composed by this class, so there is no need to parse the URL
+        base_url = f"{self._api_prefixes[version]}{path}"
+        if not query:
+            return base_url
+        return f"{base_url}?{urlencode(query)}"
 
     def _get(
         self,
@@ -635,16 +853,13 @@ class ConfluenceSession:
         "Executes an HTTP request via Confluence API."
 
         url = self._build_url(version, path, query)
-        response = _retry_request(self.session.get, url, headers={"Accept": "application/json"}, verify=True)
-        if response.text:
-            LOGGER.debug("Received HTTP payload:\n%s", response.text)
-        response.raise_for_status()
+        response = _retry_request(self.session.get, url, headers=_ACCEPT_JSON, verify=True)
+        _check_response(response)
         return _json_to_object(response_type, response.json())
 
-    def _fetch_v1(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
-        "Retrieves all results of a REST API v1 paginated result-set."
+    def _iter_v1(self, path: str, query: Optional[dict[str, str]] = None) -> Iterator[JsonType]:
+        "Iterates over all results of a REST API v1 paginated result-set, fetching pages as needed."
 
-        items: list[JsonType] = []
         start = 0
         limit = 200
 
@@ -654,10 +869,10 @@ class ConfluenceSession:
             paginated_query["start"] = str(start)
             paginated_query["limit"] = str(limit)
 
-            data = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query=paginated_query)
+            data = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query=paginated_query)
 
-            results = typing.cast(list[JsonType], data.get("results", []))
-            items.extend(results)
+            results = typing.cast(JsonArray, data.get("results", []))
+            yield from results
 
             # Check if there are more results
             size = int(data.get("size", 0))
@@ -665,50 +880,60 @@ class ConfluenceSession:
                 break
             start += limit
 
-        return items
-
-    def _fetch(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
-        """
-        Retrieves all results of a REST API paginated result-set.
+    def _iter_v2(self, path: str, query: Optional[dict[str, str]] = None) -> Iterator[JsonType]:
+        "Iterates over all results of a REST API v2 paginated result-set, fetching pages as needed."
 
-        Routes to v1 or v2 pagination based on api_version.
-        """
-        if self.api_version == ConfluenceVersion.VERSION_1:
-            return self._fetch_v1(path, query)
-        else:
-            return self._fetch_v2(path, query)
-
-    def _fetch_v2(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
-        "Retrieves all results of a REST API v2 paginated result-set."
-
-        items: list[JsonType] = []
         url = self._build_url(ConfluenceVersion.VERSION_2, path, query)
         while True:
-            response = _retry_request(self.session.get, url, headers={"Accept": "application/json"}, verify=True)
+            response = _retry_request(self.session.get, url, headers=_ACCEPT_JSON, verify=True)
             response.raise_for_status()
 
-            payload = typing.cast(dict[str, JsonType], response.json())
-            results = typing.cast(list[JsonType], payload["results"])
-            items.extend(results)
+            payload = typing.cast(JsonObject, response.json())
+            results = typing.cast(JsonArray, payload["results"])
+            yield from results
 
-            links = typing.cast(dict[str, JsonType], payload.get("_links", {}))
+            links = typing.cast(JsonObject, payload.get("_links", {}))
             link = typing.cast(str, links.get("next", ""))
             if link:
                 url = f"https://{self.site.domain}{link}"
             else:
                 break
 
-        return items
+    def _iter(self, path: str, query: Optional[dict[str, str]] = None) -> Iterator[JsonType]:
+        """
+        Iterates over all results of a REST API paginated result-set.
+
+        Routes to v1 or v2 pagination based on api_version.
+        """
+        if self.api_version is ConfluenceVersion.VERSION_1:
+            return self._iter_v1(path, query)
+        else:
+            return self._iter_v2(path, query)
+
+    def _fetch_v1(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
+        "Retrieves all results of a REST API v1 paginated result-set."
+
+        return list(self._iter_v1(path, query))
+
+    def _fetch(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
+        """
+        Retrieves all results of a REST API paginated result-set.
+
+        Routes to v1 or v2 pagination based on api_version.
+        """
+        return list(self._iter(path, query))
+
+    def _fetch_v2(self, path: str, query: Optional[dict[str, str]] = None) -> list[JsonType]:
+        "Retrieves all results of a REST API v2 paginated result-set."
+
+        return list(self._iter_v2(path, query))
 
     def _build_request(self, version: ConfluenceVersion, path: str, body: Any, response_type: Optional[type[T]]) -> tuple[str, dict[str, str], bytes]:
         "Generates URL, headers and raw payload for a typed request/response."
 
         url = self._build_url(version, path)
-        headers = {"Content-Type": "application/json"}
-        if response_type is not None:
-            headers["Accept"] = "application/json"
-        data = json_dump_string(object_to_json(body)).encode("utf-8")
-        return url, headers, data
+        headers = _SEND_RECEIVE_JSON if response_type is not None else _SEND_JSON
+        return url, headers, _json_encode(body)
 
     @overload
     def _post(self, version: ConfluenceVersion, path: str, body: Any, response_type: None) -> None: ...
@@ -768,27 +993,30 @@ class ConfluenceSession:
 
         # Check cache first (works for both versions)
         key = self._space_id_to_key.get(id)
-        if key is None:
-            # Route to appropriate API version
-            if self.api_version == ConfluenceVersion.VERSION_1:
-                key = self._space_id_to_key_v1(id)
-            else:
-                # v2 implementation
-                data = self._get(
-                    ConfluenceVersion.VERSION_2,
-                    "/spaces",
-                    dict[str, JsonType],
-                    query={"ids": id, "status": "current"},
-                )
-                results = typing.cast(list[JsonType], data["results"])
-                if len(results) != 1:
-                    raise ConfluenceError(f"unique space not found with id: {id}")
-
-                result = typing.cast(dict[str, JsonType], results[0])
-                key = typing.cast(str, result["key"])
+        if key is not None:
+            return key
+
+        # Route to appropriate API version
+        if self.api_version is ConfluenceVersion.VERSION_1:
+            return self._space_id_to_key_v1(id)
+
+        # v2 implementation
+        data = self._get(
+            ConfluenceVersion.VERSION_2,
+            "/spaces",
+            JsonObject,
+            query={"ids": id, "status": "current"},
+        )
+        results = typing.cast(JsonArray, data["results"])
+        if len(results) != 1:
+            raise ConfluenceError(f"unique space not found with id: {id}")
 
-                self._space_id_to_key[id] = key
+        result = typing.cast(JsonObject, results[0])
+        key = typing.cast(str, result["key"])
 
+        self._space_id_to_key[id] = key
+        # Populate reverse cache
+        self._space_key_to_id[key] = id
         return key
 
     def _space_key_to_id_v1(self, key: str) -> str:
@@ -808,7 +1036,7 @@ class ConfluenceSession:
         response = self._get(
             ConfluenceVersion.VERSION_1,
             f"/space/{key}",
-            dict[str, JsonType],
+            JsonObject,
         )
         space_id = map_space_v1_to_id(response)
         self._space_key_to_id[key] = space_id
@@ -819,30 +1047,32 @@ class ConfluenceSession:
     def space_key_to_id(self, key: str) -> str:
         "Finds the Confluence space ID for a space key."
 
+        # Check cache first (works for both versions)
         id = self._space_key_to_id.get(key)
-        if id is None:
-            # Route to appropriate API version
-            if self.api_version == ConfluenceVersion.VERSION_1:
-                id = self._space_key_to_id_v1(key)
-            else:
-                # v2 implementation
-                data = self._get(
-                    ConfluenceVersion.VERSION_2,
-                    "/spaces",
-                    dict[str, JsonType],
-                    query={"keys": key, "status": "current"},
-                )
-                results = typing.cast(list[JsonType], data["results"])
-                if len(results) != 1:
-                    raise ConfluenceError(f"unique space not found with key: {key}")
-
-                result = typing.cast(dict[str, JsonType], results[0])
-                id = typing.cast(str, result["id"])
+        if id is not None:
+            return id
+
+        # Route to appropriate API version
+        if self.api_version is ConfluenceVersion.VERSION_1:
+            return self._space_key_to_id_v1(key)
+
+        # v2 implementation
+        data = self._get(
+            ConfluenceVersion.VERSION_2,
+            "/spaces",
+            JsonObject,
+            query={"keys": key, "status": "current"},
+        )
+        results = typing.cast(JsonArray, data["results"])
+        if len(results) != 1:
+            raise ConfluenceError(f"unique space not found with key: {key}")
 
-                self._space_key_to_id[key] = id
-                # Populate reverse cache
-                self._space_id_to_key[id] = key
+        result = typing.cast(JsonObject, results[0])
+        id = typing.cast(str, result["id"])
 
+        self._space_key_to_id[key] = id
+        # Populate reverse cache
+        self._space_id_to_key[id] = key
         return id
 
     def get_space_id(self, *, space_id: Optional[str] = None, space_key: Optional[str] = None) -> Optional[str]:
@@ -875,28 +1105,28 @@ class ConfluenceSession:
         from .api_mappers import map_attachment_v1_to_domain
 
         path = f"/content/{page_id}/child/attachment"
-        data = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query={"filename": filename})
+        data = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query={"filename": filename})
 
-        results = typing.cast(list[JsonType], data.get("results", []))
+        results = typing.cast(JsonArray, data.get("results", []))
         if len(results) != 1:
             raise ConfluenceError(f"no such attachment on page {page_id}: {filename}")
-        result = typing.cast(dict[str, JsonType], results[0])
+        result = typing.cast(JsonObject, results[0])
         return map_attachment_v1_to_domain(result)
 
     def get_attachment_by_name(self, page_id: str, filename: str) -> ConfluenceAttachment:
         """
         Retrieves a Confluence page attachment by an unprefixed file name.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_attachment_by_name_v1(page_id, filename)
         else:
             path = f"/pages/{page_id}/attachments"
-            data = self._get(ConfluenceVersion.VERSION_2, path, dict[str, JsonType], query={"filename": filename})
+            data = self._get(ConfluenceVersion.VERSION_2, path, JsonObject, query={"filename": filename})
 
-            results = typing.cast(list[JsonType], data["results"])
+            results = typing.cast(JsonArray, data["results"])
             if len(results) != 1:
                 raise ConfluenceError(f"no such attachment on page {page_id}: {filename}")
-            result = typing.cast(dict[str, JsonType], results[0])
+            result = typing.cast(JsonObject, results[0])
             return _json_to_object(ConfluenceAttachment, result)
 
     def upload_attachment(
@@ -930,22 +1160,27 @@ class ConfluenceSession:
 
         if content_type is None:
             if attachment_path is not None:
-                name = str(attachment_path)
+                name = attachment_path.name
             else:
                 name = attachment_name
-            content_type, _ = mimetypes.guess_type(name, strict=True)
-
-            if content_type is None:
-                content_type = "application/octet-stream"
+            content_type = _guess_content_type("".join(PurePath(name).suffixes))
 
-        if attachment_path is not None and not attachment_path.is_file():
-            raise PageError(f"file not found: {attachment_path}")
+        # query file status once, both to check that the file exists and to compare its size
+        file_size: Optional[int] = None
+        if attachment_path is not None:
+            try:
+                file_status = attachment_path.stat()
+            except OSError:
+                raise PageError(f"file not found: {attachment_path}") from None
+            if not stat.S_ISREG(file_status.st_mode):
+                raise PageError(f"file not found: {attachment_path}")
+            file_size = file_status.st_size
 
         try:
             attachment = self.get_attachment_by_name(page_id, attachment_name)
 
             if attachment_path is not None:
-                if not force and attachment.fileSize == attachment_path.stat().st_size:
+                if not force and attachment.fileSize == file_size:
                     LOGGER.info("Up-to-date attachment: %s", attachment_name)
                     return
             elif raw_data is not None:
@@ -963,63 +1198,37 @@ class ConfluenceSession:
 
         url = self._build_url(ConfluenceVersion.VERSION_1, path)
 
+        # pass file content as `bytes`: `requests` reads file objects into memory anyway when it builds the multipart body,
+        # and a file object consumed by the first attempt would be sent empty if the request is retried
         if attachment_path is not None:
-            with open(attachment_path, "rb") as attachment_file:
-                file_to_upload: dict[str, tuple[Optional[str], Any, str, dict[str, str]]] = {
-                    "comment": (
-                        None,
-                        comment,
-                        "text/plain; charset=utf-8",
-                        {},
-                    ),
-                    "file": (
-                        attachment_name,  # will truncate path component
-                        attachment_file,
-                        content_type,
-                        {"Expires": "0"},
-                    ),
-                }
-                LOGGER.info("Uploading attachment: %s", attachment_name)
-                response = _retry_request(self.session.post,
-                    url,
-                    files=file_to_upload,
-                    headers={
-                        "X-Atlassian-Token": "no-check",
-                        "Accept": "application/json",
-                    },
-                    verify=True,
-                )
+            LOGGER.info("Uploading attachment: %s", attachment_name)
+            file_data = attachment_path.read_bytes()
         elif raw_data is not None:
             LOGGER.info("Uploading raw data: %s", attachment_name)
-
-            raw_file = io.BytesIO(raw_data)
-            raw_file.name = attachment_name
-            file_to_upload = {
-                "comment": (
-                    None,
-                    comment,
-                    "text/plain; charset=utf-8",
-                    {},
-                ),
-                "file": (
-                    attachment_name,  # will truncate path component
-                    raw_file,
-                    content_type,
-                    {"Expires": "0"},
-                ),
-            }
-            response = _retry_request(self.session.post,
-                url,
-                files=file_to_upload,
-                headers={
-                    "X-Atlassian-Token": "no-check",
-                    "Accept": "application/json",
-                },
-                verify=True,
-            )
+            file_data = raw_data
         else:
             raise NotImplementedError("parameter match not exhaustive")
 
+        file_to_upload: dict[str, tuple[Optional[str], Any, str, dict[str, str]]] = {
+            "comment": (
+                None,
+                comment,
+                "text/plain; charset=utf-8",
+                {},
+            ),
+            "file": (
+                attachment_name,  # will truncate path component
+                file_data,
+                content_type,
+                {"Expires": "0"},
+            ),
+        }
+        response = _retry_request(self.session.post,
+            url,
+            files=file_to_upload,
+            headers=_UPLOAD_HEADERS,
+            verify=True,
+        )
         response.raise_for_status()
         data = response.json()
 
@@ -1028,11 +1237,39 @@ class ConfluenceSession:
         else:
             result = data
 
-        attachment_id = result["id"]
-        version = result["version"]["number"] + 1
-
         # ensure path component is retained in attachment name
-        self._update_attachment(page_id, attachment_id, version, attachment_name)
+        if result.get("title") != attachment_name:
+            attachment_id = result["id"]
+            version = result["version"]["number"] + 1
+            self._update_attachment(page_id, attachment_id, version, attachment_name)
+
+    def upload_attachments(self, page_id: str, attachments: list[ConfluenceAttachmentUpload], *, force: bool = False) -> None:
+        """
+        Uploads several attachments to a Confluence page, overlapping network round trips.
+
+        Each attachment is processed as with :meth:`upload_attachment`. If an attachment name occurs more than once, only the
+        first occurrence is uploaded, as a sequential upload would skip the rest as up-to-date.
+
+        :param page_id: Confluence page ID.
+        :param attachments: Attachments to upload.
+        :param force: Overwrite existing attachments even if there seem to be no changes.
+        """
+
+        unique: dict[str, ConfluenceAttachmentUpload] = {}
+        for attachment in attachments:
+            unique.setdefault(attachment.name, attachment)
+
+        def upload(attachment: ConfluenceAttachmentUpload) -> None:
+            self.upload_attachment(
+                page_id,
+                attachment.name,
+                attachment_path=attachment.attachment_path,
+                raw_data=attachment.raw_data,
+                comment=attachment.comment,
+                force=force,
+            )
+
+        _for_each_concurrently(upload, list(unique.values()))
 
     def _update_attachment(self, page_id: str, attachment_id: str, version: int, attachment_title: str) -> None:
         id = attachment_id.removeprefix("att")
@@ -1087,12 +1324,12 @@ class ConfluenceSession:
         if space_key is not None:
             query["spaceKey"] = space_key
 
-        data = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query=query)
-        results = typing.cast(list[JsonType], data.get("results", []))
+        data = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query=query)
+        results = typing.cast(JsonArray, data.get("results", []))
         if len(results) != 1:
             raise ConfluenceError(f"unique page not found with title: {title}")
 
-        return map_page_properties_v1_to_domain(results[0])
+        return map_page_properties_v1_to_domain(typing.cast(JsonObject, results[0]))
 
     def get_page_properties_by_title(
         self,
@@ -1109,7 +1346,7 @@ class ConfluenceSession:
         :param space_key: The Confluence space key (unless the default space is to be used). Exclusive with space ID.
         :returns: Confluence page ID.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_page_properties_by_title_v1(title, space_id=space_id, space_key=space_key)
         else:
             LOGGER.info("Looking up page with title: %s", title)
@@ -1121,8 +1358,8 @@ class ConfluenceSession:
             if space_id is not None:
                 query["space-id"] = space_id
 
-            data = self._get(ConfluenceVersion.VERSION_2, path, dict[str, JsonType], query=query)
-            results = typing.cast(list[JsonType], data["results"])
+            data = self._get(ConfluenceVersion.VERSION_2, path, JsonObject, query=query)
+            results = typing.cast(JsonArray, data["results"])
             if len(results) != 1:
                 raise ConfluenceError(f"unique page not found with title: {title}")
 
@@ -1142,7 +1379,7 @@ class ConfluenceSession:
 
         path = f"/content/{page_id}"
         query = {"expand": "body.storage,version,space,ancestors"}
-        response = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query=query)
+        response = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query=query)
         return map_page_v1_to_domain(response)
 
     def get_page(self, page_id: str) -> ConfluencePage:
@@ -1152,7 +1389,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :returns: Confluence page info and content.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_page_v1(page_id)
         else:
             path = f"/pages/{page_id}"
@@ -1171,7 +1408,7 @@ class ConfluenceSession:
 
         path = f"/content/{page_id}"
         query = {"expand": "version,space,history,ancestors"}
-        response = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query=query)
+        response = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query=query)
         return map_page_properties_v1_to_domain(response)
 
     def get_page_properties(self, page_id: str) -> ConfluencePageProperties:
@@ -1181,7 +1418,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :returns: Confluence page info.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_page_properties_v1(page_id)
         else:
             path = f"/pages/{page_id}"
@@ -1206,7 +1443,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :returns: Ancestor page IDs, from the topmost ancestor down to the immediate parent.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_ancestor_ids_v1(page_id)
         else:
             return self._get_ancestor_ids_v2(page_id)
@@ -1216,9 +1453,9 @@ class ConfluenceSession:
 
         path = f"/content/{page_id}"
         query = {"expand": "ancestors"}
-        response = self._get(ConfluenceVersion.VERSION_1, path, dict[str, JsonType], query=query)
-        ancestors = typing.cast(list[JsonType], response.get("ancestors", []))
-        return [str(typing.cast(dict[str, JsonType], item)["id"]) for item in ancestors]
+        response = self._get(ConfluenceVersion.VERSION_1, path, JsonObject, query=query)
+        ancestors = typing.cast(JsonArray, response.get("ancestors", []))
+        return [str(typing.cast(JsonObject, item)["id"]) for item in ancestors]
 
     def _get_ancestor_ids_v2(self, page_id: str) -> list[str]:
         "Retrieves ancestors using the v2 API by walking up the parent chain."
@@ -1241,10 +1478,10 @@ class ConfluenceSession:
 
         v1 endpoint: GET /rest/api/user/search?username={name}
         """
-        results = self._fetch_v1("/user/search", {"username": name})
+        results = self._iter_v1("/user/search", {"username": name})
         users: list[ConfluenceUser] = []
         for item in results:
-            data = typing.cast(dict[str, JsonType], item)
+            data = typing.cast(JsonObject, item)
             email = typing.cast(Optional[str], data.get("emailAddress"))
             login_name = typing.cast(Optional[str], data.get("name"))
             if login_name is not None:
@@ -1258,12 +1495,12 @@ class ConfluenceSession:
         Uses the v1-style REST path (still valid on Cloud): GET /rest/api/user/search?query={name}
         """
         url = self._build_url(ConfluenceVersion.VERSION_1, "/user/search", {"query": name, "limit": "10"})
-        response = _retry_request(self.session.get, url, headers={"Accept": "application/json"}, verify=True)
+        response = _retry_request(self.session.get, url, headers=_ACCEPT_JSON, verify=True)
         response.raise_for_status()
-        results = typing.cast(list[JsonType], response.json())
+        results = typing.cast(JsonArray, response.json())
         users: list[ConfluenceUser] = []
         for item in results:
-            data = typing.cast(dict[str, JsonType], item)
+            data = typing.cast(JsonObject, item)
             email = typing.cast(Optional[str], data.get("email"))
             account_id = typing.cast(Optional[str], data.get("accountId"))
             if account_id is not None:
@@ -1277,7 +1514,7 @@ class ConfluenceSession:
         :param name: Display name (or substring) to search for.
         :returns: List of matching ``ConfluenceUser`` objects.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_users_v1(name)
         else:
             return self._get_users_v2(name)
@@ -1289,7 +1526,7 @@ class ConfluenceSession:
         *,
         title: str,
         version: int,
-    ) -> None:
+    ) -> ConfluencePageProperties:
         """
         Updates a page via the Confluence v1 API.
 
@@ -1299,13 +1536,17 @@ class ConfluenceSession:
         :param content: Confluence Storage Format XHTML.
         :param title: New title to assign to the page. Needs to be unique within a space.
         :param version: New version to assign to the page.
+        :returns: Confluence page info, as returned by the update operation.
         """
-        from .api_mappers import map_update_page_to_v1
+        from .api_mappers import map_page_properties_v1_to_domain, map_update_page_to_v1
 
         LOGGER.info("Updating page: %s", page_id)
 
         # For v1 API, we use the space key from session properties
         space_key = self.site.space_key
+        if space_key is None:
+            # checked before the page is written, as the space is needed to interpret the response too
+            raise ArgumentError("Confluence space key not specified; required to update a page with the v1 API")
 
         request = ConfluenceUpdatePageRequest(
             id=page_id,
@@ -1319,14 +1560,14 @@ class ConfluenceSession:
         v1_request = map_update_page_to_v1(page_id, request, space_key)
 
         path = f"/content/{page_id}"
-        url = self._build_url(ConfluenceVersion.VERSION_1, path)
+        url = self._build_url(ConfluenceVersion.VERSION_1, path, {"expand": "space,version"})
         LOGGER.info(f"Updating page at URL: {url}")
         LOGGER.info(f"Request body: {v1_request}")
 
         response = _retry_request(self.session.put,
             url,
-            json=v1_request,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            data=_json_dump(v1_request),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         if response.status_code >= 400:
@@ -1335,6 +1576,16 @@ class ConfluenceSession:
             LOGGER.error(f"Response body: {response.text}")
         response.raise_for_status()
 
+        # the page has already been written; fields missing from the response are filled in from the request
+        data = typing.cast(JsonObject, response.json())
+        data.setdefault("id", page_id)
+        data.setdefault("title", title)
+        data.setdefault("status", ConfluenceStatus.CURRENT.value)
+        data.setdefault("version", {"number": version})
+        if "space" not in data:
+            data["space"] = {"id": self.space_key_to_id(space_key), "key": space_key}
+        return map_page_properties_v1_to_domain(data)
+
     def update_page(
         self,
         page_id: str,
@@ -1342,7 +1593,7 @@ class ConfluenceSession:
         *,
         title: str,
         version: int,
-    ) -> None:
+    ) -> ConfluencePageProperties:
         """
         Updates a page via the Confluence API.
 
@@ -1350,9 +1601,10 @@ class ConfluenceSession:
         :param content: Confluence Storage Format XHTML.
         :param title: New title to assign to the page. Needs to be unique within a space.
         :param version: New version to assign to the page.
+        :returns: Confluence page info, as returned by the update operation.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
-            self._update_page_v1(page_id, content, title=title, version=version)
+        if self.api_version is ConfluenceVersion.VERSION_1:
+            return self._update_page_v1(page_id, content, title=title, version=version)
         else:
             path = f"/pages/{page_id}"
             request = ConfluenceUpdatePageRequest(
@@ -1363,7 +1615,7 @@ class ConfluenceSession:
                 version=ConfluenceContentVersion(number=version, minorEdit=True),
             )
             LOGGER.info("Updating page: %s", page_id)
-            self._put(ConfluenceVersion.VERSION_2, path, request, None)
+            return self._put(ConfluenceVersion.VERSION_2, path, request, ConfluencePageProperties)
 
     def move_page(self, page_id: str, new_parent_id: str) -> None:
         """
@@ -1372,7 +1624,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID to move.
         :param new_parent_id: The Confluence page ID of the new parent.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             self._move_page_v1(page_id, new_parent_id)
         else:
             self._move_page_v2(page_id, new_parent_id)
@@ -1386,8 +1638,9 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID to move.
         :param new_parent_id: The Confluence page ID of the new parent.
         """
-        page = self.get_page(page_id)
-        v1_request = {
+        # title and version suffice; skip fetching the page body
+        page = self.get_page_properties(page_id)
+        v1_request: JsonObject = {
             "id": page_id,
             "type": "page",
             "title": page.title,
@@ -1401,8 +1654,8 @@ class ConfluenceSession:
 
         response = _retry_request(self.session.put,
             url,
-            json=v1_request,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            data=_json_dump(v1_request),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         if response.status_code >= 400:
@@ -1420,7 +1673,7 @@ class ConfluenceSession:
         :param new_parent_id: The Confluence page ID of the new parent.
         """
         page = self.get_page_properties(page_id)
-        request = {
+        request: JsonObject = {
             "id": page_id,
             "status": "current",
             "title": page.title,
@@ -1434,8 +1687,8 @@ class ConfluenceSession:
 
         response = _retry_request(self.session.put,
             url,
-            json=request,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            data=_json_dump(request),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         if response.status_code >= 400:
@@ -1450,10 +1703,10 @@ class ConfluenceSession:
         v1: GET /rest/api/content/{parent_id}/child/page?limit=250
         """
         try:
-            results = self._fetch_v1(f"/content/{parent_id}/child/page", {"limit": "250"})
+            results = self._iter_v1(f"/content/{parent_id}/child/page", {"limit": "250"})
             page_ids: list[str] = []
             for item in results:
-                data = typing.cast(dict[str, JsonType], item)
+                data = typing.cast(JsonObject, item)
                 page_id = typing.cast(Optional[str], data.get("id"))
                 if page_id is not None:
                     page_ids.append(page_id)
@@ -1469,10 +1722,10 @@ class ConfluenceSession:
         v2: GET /wiki/api/v2/pages/{parent_id}/children?limit=250&sort=child-position
         """
         try:
-            results = self._fetch_v2(f"/pages/{parent_id}/children", {"limit": "250", "sort": "child-position"})
+            results = self._iter_v2(f"/pages/{parent_id}/children", {"limit": "250", "sort": "child-position"})
             page_ids: list[str] = []
             for item in results:
-                data = typing.cast(dict[str, JsonType], item)
+                data = typing.cast(JsonObject, item)
                 page_id = typing.cast(Optional[str], data.get("id"))
                 if page_id is not None:
                     page_ids.append(page_id)
@@ -1490,7 +1743,7 @@ class ConfluenceSession:
         :param parent_id: Confluence page ID of the parent page.
         :returns: Ordered list of child page IDs.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._get_child_page_ids_v1(parent_id)
         else:
             return self._get_child_page_ids_v2(parent_id)
@@ -1502,7 +1755,7 @@ class ConfluenceSession:
         v1: PUT /rest/api/content/{pageId}/move/before/{refId}
         """
         url = self._build_url(ConfluenceVersion.VERSION_1, f"/content/{page_id}/move/before/{ref_id}")
-        response = _retry_request(self.session.put, url, headers={"Accept": "application/json"}, verify=True)
+        response = _retry_request(self.session.put, url, headers=_ACCEPT_JSON, verify=True)
         response.raise_for_status()
 
     def _move_page_before_sibling_v2(self, page_id: str, ref_id: str) -> None:
@@ -1515,8 +1768,8 @@ class ConfluenceSession:
         response = _retry_request(
             self.session.put,
             url,
-            json={"position": "before", "targetId": ref_id},
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            data=_json_dump({"position": "before", "targetId": ref_id}),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         response.raise_for_status()
@@ -1534,7 +1787,7 @@ class ConfluenceSession:
         """
         LOGGER.info("Moving page %s before sibling %s", page_id, ref_id)
         try:
-            if self.api_version == ConfluenceVersion.VERSION_1:
+            if self.api_version is ConfluenceVersion.VERSION_1:
                 self._move_page_before_sibling_v1(page_id, ref_id)
             else:
                 self._move_page_before_sibling_v2(page_id, ref_id)
@@ -1555,7 +1808,7 @@ class ConfluenceSession:
         v1: PUT /rest/api/content/{pageId}/move/after/{refId}
         """
         url = self._build_url(ConfluenceVersion.VERSION_1, f"/content/{page_id}/move/after/{ref_id}")
-        response = _retry_request(self.session.put, url, headers={"Accept": "application/json"}, verify=True)
+        response = _retry_request(self.session.put, url, headers=_ACCEPT_JSON, verify=True)
         response.raise_for_status()
 
     def _move_page_after_sibling_v2(self, page_id: str, ref_id: str) -> None:
@@ -1568,8 +1821,8 @@ class ConfluenceSession:
         response = _retry_request(
             self.session.put,
             url,
-            json={"position": "after", "targetId": ref_id},
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            data=_json_dump({"position": "after", "targetId": ref_id}),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         response.raise_for_status()
@@ -1587,7 +1840,7 @@ class ConfluenceSession:
         """
         LOGGER.info("Moving page %s after sibling %s", page_id, ref_id)
         try:
-            if self.api_version == ConfluenceVersion.VERSION_1:
+            if self.api_version is ConfluenceVersion.VERSION_1:
                 self._move_page_after_sibling_v1(page_id, ref_id)
             else:
                 self._move_page_after_sibling_v2(page_id, ref_id)
@@ -1645,8 +1898,8 @@ class ConfluenceSession:
         # Note: Some title/content combinations may trigger WAF rules (e.g. "API Test Page")
         response = _retry_request(self.session.post,
             url,
-            json=v1_request,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            data=_json_dump(v1_request),
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         if response.status_code >= 400:
@@ -1665,7 +1918,7 @@ class ConfluenceSession:
         """
         Creates a new page via Confluence API.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._create_page_v1(parent_id, title, new_content)
         else:
             LOGGER.info("Creating page: %s", title)
@@ -1686,18 +1939,7 @@ class ConfluenceSession:
                 ),
             )
 
-            url = self._build_url(ConfluenceVersion.VERSION_2, path)
-            response = _retry_request(self.session.post,
-                url,
-                data=json_dump_string(object_to_json(request)).encode("utf-8"),
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
-                verify=True,
-            )
-            response.raise_for_status()
-            return _json_to_object(ConfluencePage, response.json())
+            return self._post(ConfluenceVersion.VERSION_2, path, request, ConfluencePage)
 
     def _delete_page_v1(self, page_id: str, *, purge: bool = False) -> None:
         """
@@ -1731,7 +1973,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :param purge: `True` to completely purge the page, `False` to move to trash only.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             self._delete_page_v1(page_id, purge=purge)
         else:
             path = f"/pages/{page_id}"
@@ -1787,23 +2029,20 @@ class ConfluenceSession:
         response = _retry_request(self.session.get,
             url,
             params=query,
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
+            headers=_SEND_RECEIVE_JSON,
             verify=True,
         )
         response.raise_for_status()
-        data = typing.cast(dict[str, JsonType], response.json())
-        results = typing.cast(list[JsonType], data.get("results", []))
+        data = typing.cast(JsonObject, response.json())
+        results = typing.cast(JsonArray, data.get("results", []))
 
         if len(results) == 1:
-            result = typing.cast(dict[str, JsonType], results[0])
+            result = typing.cast(JsonObject, results[0])
             return str(result["id"])
         elif not results:
             return None
         else:
-            items = [typing.cast(dict[str, JsonType], item) for item in results]
+            items = [typing.cast(JsonObject, item) for item in results]
             matches = ", ".join(f"{item['id']} (status: {item.get('status')})" for item in items)
             raise PageCollisionError(f"ambiguous page lookup: {len(results)} pages in space {space_key} match the title {title!r}: {matches}")
 
@@ -1822,7 +2061,7 @@ class ConfluenceSession:
 
         :returns: Confluence page ID of a matching page (if found), or `None`.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._page_exists_v1(title, space_id=space_id, space_key=space_key)
         else:
             space_id = self.get_space_id(space_id=space_id, space_key=space_key)
@@ -1837,14 +2076,11 @@ class ConfluenceSession:
             response = _retry_request(self.session.get,
                 url,
                 params=query,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
+                headers=_SEND_RECEIVE_JSON,
                 verify=True,
             )
             response.raise_for_status()
-            data = typing.cast(dict[str, JsonType], response.json())
+            data = typing.cast(JsonObject, response.json())
             results = _json_to_object(list[ConfluencePageProperties], data["results"])
 
             if len(results) == 1:
@@ -1862,12 +2098,12 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :returns: A list of page labels.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             from .api_mappers import map_label_v1_to_domain
 
             path = f"/content/{page_id}/label"
-            results = self._fetch(path)
-            return [map_label_v1_to_domain(typing.cast(dict[str, JsonType], item)) for item in results]
+            items = self._iter_v1(path)
+            return [map_label_v1_to_domain(typing.cast(JsonObject, item)) for item in items]
         else:
             path = f"/pages/{page_id}/labels"
             results = self._fetch(path)
@@ -1893,14 +2129,14 @@ class ConfluenceSession:
         """
 
         path = f"/content/{page_id}/label"
-        for label in labels:
-            query = {"name": label.name}
 
-            url = self._build_url(ConfluenceVersion.VERSION_1, path, query)
+        # the REST API removes a single label per request
+        def remove_label(label: ConfluenceLabel) -> None:
+            url = self._build_url(ConfluenceVersion.VERSION_1, path, {"name": label.name})
             response = _retry_request(self.session.delete, url, verify=True)
-            if response.text:
-                LOGGER.debug("Received HTTP payload:\n%s", response.text)
-            response.raise_for_status()
+            _check_response(response)
+
+        _for_each_concurrently(remove_label, labels)
 
     def update_labels(self, page_id: str, labels: list[ConfluenceLabel], *, keep_existing: bool = False) -> None:
         """
@@ -1916,12 +2152,15 @@ class ConfluenceSession:
         add_labels = list(new_labels - old_labels)
         remove_labels = list(old_labels - new_labels)
 
+        # adding and removing touch disjoint sets of labels, and may proceed at the same time
+        actions: list[Callable[[], None]] = []
         if add_labels:
             add_labels.sort()
-            self.add_labels(page_id, add_labels)
+            actions.append(functools.partial(self.add_labels, page_id, add_labels))
         if not keep_existing and remove_labels:
             remove_labels.sort()
-            self.remove_labels(page_id, remove_labels)
+            actions.append(functools.partial(self.remove_labels, page_id, remove_labels))
+        _for_each_concurrently(_invoke, actions)
 
     def _add_content_property_to_page_v1(self, page_id: str, property: ConfluenceContentProperty) -> ConfluenceIdentifiedContentProperty:
         """
@@ -1940,42 +2179,54 @@ class ConfluenceSession:
         # v1 API expects the property object directly
         request_body = {"key": property.key, "value": property.value}
 
-        response_data = self._post(ConfluenceVersion.VERSION_1, path, request_body, dict[str, JsonType])
-        return map_property_v1_to_domain(response_data)
+        response_data = self._post(ConfluenceVersion.VERSION_1, path, request_body, JsonObject)
+        added = map_property_v1_to_domain(response_data)
+        self._property_id_to_key[added.id] = added.key
+        return added
 
-    def _remove_content_property_from_page_v1(self, page_id: str, property_id: str) -> None:
+    def _get_content_property_key_v1(self, page_id: str, property_id: str) -> str:
         """
-        Removes a content property from a Confluence page using v1 API.
+        Finds the key of a content property by its ID, as required by v1 API endpoints.
 
-        v1 API endpoint: DELETE /rest/api/content/{pageId}/property/{key}
-
-        Note: v1 API uses property key in URL, not property ID. We need to look up the key first.
-        This requires an additional API call to fetch all properties and find the matching ID.
-
-        Performance consideration: This adds one extra GET request per delete operation.
+        Keys of properties seen by earlier calls are cached; otherwise, all properties of the page are fetched.
 
         :param page_id: The Confluence page ID.
         :param property_id: Property ID, which uniquely identifies the property.
+        :returns: Property key.
         """
-        # First, get all properties to find the key for this ID
-        # Limitation: v1 API requires key not ID, so we must look it up
-        properties = self.get_content_properties_for_page(page_id)
 
-        # Find the property with matching ID
-        property_key = None
-        for prop in properties:
-            if prop.id == property_id:
-                property_key = prop.key
-                break
+        property_key = self._property_id_to_key.get(property_id)
+        if property_key is not None:
+            return property_key
 
+        # Limitation: v1 API requires key not ID, so we must look it up (which populates the cache)
+        self.get_content_properties_for_page(page_id)
+
+        property_key = self._property_id_to_key.get(property_id)
         if property_key is None:
             raise PageError(f"Property with ID {property_id} not found on page {page_id}")
+        return property_key
+
+    def _remove_content_property_from_page_v1(self, page_id: str, property_id: str) -> None:
+        """
+        Removes a content property from a Confluence page using v1 API.
+
+        v1 API endpoint: DELETE /rest/api/content/{pageId}/property/{key}
+
+        Note: v1 API uses property key in URL, not property ID. The key is looked up by ID, which takes an additional
+        API call to fetch all properties unless the property has been seen before (e.g. listed or added).
+
+        :param page_id: The Confluence page ID.
+        :param property_id: Property ID, which uniquely identifies the property.
+        """
+        property_key = self._get_content_property_key_v1(page_id, property_id)
 
         # Now delete using the key
         path = f"/content/{page_id}/property/{property_key}"
         url = self._build_url(ConfluenceVersion.VERSION_1, path)
         response = _retry_request(self.session.delete, url, verify=True)
         response.raise_for_status()
+        self._property_id_to_key.pop(property_id, None)
 
     def get_content_properties_for_page(self, page_id: str) -> list[ConfluenceIdentifiedContentProperty]:
         """
@@ -1984,12 +2235,16 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :returns: A list of content properties.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             from .api_mappers import map_property_v1_to_domain
 
             path = f"/content/{page_id}/property"
-            results = self._fetch(path)
-            return [map_property_v1_to_domain(typing.cast(dict[str, JsonType], item)) for item in results]
+            items = self._iter_v1(path)
+            properties = [map_property_v1_to_domain(typing.cast(JsonObject, item)) for item in items]
+
+            # v1 API endpoints address properties by key, while callers refer to them by ID
+            self._property_id_to_key.update((prop.id, prop.key) for prop in properties)
+            return properties
         else:
             path = f"/pages/{page_id}/properties"
             results = self._fetch(path)
@@ -2002,7 +2257,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :param property: Content property to add.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._add_content_property_to_page_v1(page_id, property)
         else:
             path = f"/pages/{page_id}/properties"
@@ -2015,7 +2270,7 @@ class ConfluenceSession:
         :param page_id: The Confluence page ID.
         :param property_id: Property ID, which uniquely identifies the property.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             self._remove_content_property_from_page_v1(page_id, property_id)
         else:
             path = f"/pages/{page_id}/properties/{property_id}"
@@ -2031,10 +2286,8 @@ class ConfluenceSession:
 
         v1 API endpoint: PUT /rest/api/content/{pageId}/property/{key}
 
-        Note: v1 API uses property key in URL, not property ID. We need to look up the key first.
-        This requires an additional API call to fetch all properties and find the matching ID.
-
-        Performance consideration: This adds one extra GET request per update operation.
+        Note: v1 API uses property key in URL, not property ID. The key is looked up by ID, which takes an additional
+        API call to fetch all properties unless the property has been seen before (e.g. listed or added).
 
         :param page_id: The Confluence page ID.
         :param property_id: Property ID, which uniquely identifies the property.
@@ -2044,26 +2297,16 @@ class ConfluenceSession:
         """
         from .api_mappers import map_property_v1_to_domain
 
-        # First, get all properties to find the key for this ID
-        # Limitation: v1 API requires key not ID, so we must look it up
-        properties = self.get_content_properties_for_page(page_id)
-
-        # Find the property with matching ID
-        property_key = None
-        for prop in properties:
-            if prop.id == property_id:
-                property_key = prop.key
-                break
-
-        if property_key is None:
-            raise PageError(f"Property with ID {property_id} not found on page {page_id}")
+        property_key = self._get_content_property_key_v1(page_id, property_id)
 
         # v1 API expects key, value, and version
         request_body = {"key": property.key, "value": property.value, "version": {"number": version}}
 
         path = f"/content/{page_id}/property/{property_key}"
-        response_data = self._put(ConfluenceVersion.VERSION_1, path, request_body, dict[str, JsonType])
-        return map_property_v1_to_domain(response_data)
+        response_data = self._put(ConfluenceVersion.VERSION_1, path, request_body, JsonObject)
+        updated = map_property_v1_to_domain(response_data)
+        self._property_id_to_key[updated.id] = updated.key
+        return updated
 
     def update_content_property_for_page(
         self, page_id: str, property_id: str, version: int, property: ConfluenceContentProperty
@@ -2077,7 +2320,7 @@ class ConfluenceSession:
         :param property: Content property data to assign.
         :returns: Updated content property data.
         """
-        if self.api_version == ConfluenceVersion.VERSION_1:
+        if self.api_version is ConfluenceVersion.VERSION_1:
             return self._update_content_property_for_page_v1(page_id, property_id, version, property)
         else:
             path = f"/pages/{page_id}/properties/{property_id}"
@@ -2101,29 +2344,39 @@ class ConfluenceSession:
         :param keep_existing: Whether to keep content property data whose key is not included in the list of properties passed as an argument.
         """
 
-        old_mapping = {p.key: p for p in self.get_content_properties_for_page(page_id)}
-        new_mapping = {p.key: p for p in properties}
-
-        new_props = set(p.key for p in properties)
-        old_props = set(old_mapping.keys())
-
-        add_props = list(new_props - old_props)
-        remove_props = list(old_props - new_props)
-        update_props = list(old_props & new_props)
+        old_properties = self.get_content_properties_for_page(page_id)
+        old_mapping: dict[str, ConfluenceIdentifiedContentProperty] = dict(zip(map(_property_key, old_properties), old_properties))
+        new_mapping: dict[str, ConfluenceContentProperty] = dict(zip(map(_property_key, properties), properties))
+
+        # classify each key in a single walk, dropping updates that would not change the stored value
+        add_props: list[ConfluenceContentProperty] = []
+        remove_props: list[ConfluenceIdentifiedContentProperty] = []
+        update_props: list[tuple[ConfluenceIdentifiedContentProperty, ConfluenceContentProperty]] = []
+        for key in sorted(old_mapping.keys() | new_mapping.keys()):
+            old_prop = old_mapping.get(key)
+            new_prop = new_mapping.get(key)
+            if old_prop is None:
+                if new_prop is not None:
+                    add_props.append(new_prop)
+            elif new_prop is None:
+                remove_props.append(old_prop)
+            elif old_prop.value != new_prop.value:
+                update_props.append((old_prop, new_prop))
+
+        # properties with distinct keys are independent; requests within each phase are issued concurrently
+        def add_property(prop: ConfluenceContentProperty) -> None:
+            self.add_content_property_to_page(page_id, prop)
+
+        def remove_property(prop: ConfluenceIdentifiedContentProperty) -> None:
+            self.remove_content_property_from_page(page_id, prop.id)
+
+        def update_property(props: tuple[ConfluenceIdentifiedContentProperty, ConfluenceContentProperty]) -> None:
+            old_prop, new_prop = props
+            self.update_content_property_for_page(page_id, old_prop.id, old_prop.version.number + 1, new_prop)
 
         if add_props:
-            add_props.sort()
-            for key in add_props:
-                self.add_content_property_to_page(page_id, new_mapping[key])
+            _for_each_concurrently(add_property, add_props)
         if not keep_existing and remove_props:
-            remove_props.sort()
-            for key in remove_props:
-                self.remove_content_property_from_page(page_id, old_mapping[key].id)
+            _for_each_concurrently(remove_property, remove_props)
         if update_props:
-            update_props.sort()
-            for key in update_props:
-                old_prop = old_mapping[key]
-                new_prop = new_mapping[key]
-                if old_prop.value == new_prop.value:
-                    continue
-                self.update_content_property_for_page(page_id, old_prop.id, old_prop.version.number + 1, new_prop)
+            _for_each_concurrently(update_property, update_props)
@@ -9,42 +9,67 @@ to v2. These mappers enable md2conf to work with v1 endpoints when necessary whi
 maintaining a consistent internal domain model.
 """
 
-from typing import Dict
+import datetime
+import functools
+import typing
+from typing import Dict, NamedTuple, Optional
 
 from strong_typing.core import JsonType
 
 from .api import (
     ConfluenceAttachment,
+    ConfluenceContentVersion,
     ConfluenceCreatePageRequest,
     ConfluenceIdentifiedContentProperty,
     ConfluenceIdentifiedLabel,
     ConfluencePage,
+    ConfluencePageBody,
     ConfluencePageProperties,
+    ConfluencePageStorage,
+    ConfluenceStatus,
     ConfluenceUpdatePageRequest,
 )
 
 
-def map_page_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePage:
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime.datetime:
     """
-    Convert Confluence REST API v1 page response to ConfluencePage domain object.
+    Parses an ISO 8601 timestamp as returned by the v1 API.
 
-    The v1 API response structure differs from v2 in several ways:
-    - Uses nested structure for space (space.id instead of spaceId)
-    - Uses nested structure for body content (body.storage.value)
-    - Uses ancestors array instead of parentId
-    - Field names may differ (e.g., version structure)
+    Older Python versions reject the `Z` designator for UTC, which is rewritten as `+00:00`. Results are cached because the same
+    timestamp (e.g. the creation date of a page) is parsed whenever a page is looked up again.
 
-    Args:
-        v1_response: JSON response from GET /rest/api/content/{id}?expand=body.storage,version,space,history
+    :raises ValueError: Raised when the string is not a valid ISO 8601 timestamp.
+    """
 
-    Returns:
-        ConfluencePage object with mapped fields
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+class _PageCommon(NamedTuple):
+    "Fields shared by the page and page properties views of a v1 page response."
+
+    id: str
+    spaceId: str
+    parentId: Optional[str]
+    status: str
+    title: str
+    version: ConfluenceContentVersion
+    authorId: str
+    createdAt: datetime.datetime
+
+
+def _extract_page_common(v1_response: Dict[str, JsonType]) -> _PageCommon:
     """
-    import datetime
-    import typing
+    Extracts the fields that are common to all page representations from a Confluence REST API v1 page response.
 
-    from .api import ConfluenceContentVersion, ConfluencePageBody, ConfluencePageStorage
+    Args:
+        v1_response: JSON response from GET /rest/api/content/{id}?expand=version,space,history
 
+    Returns:
+        Fields shared by ConfluencePage and ConfluencePageProperties
+    """
     # Extract basic fields
     page_id = str(v1_response["id"])
     title = str(v1_response["title"])
@@ -61,12 +86,6 @@ def map_page_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePage:
         last_ancestor = typing.cast(Dict[str, JsonType], ancestors[-1])
         parent_id = str(last_ancestor["id"])
 
-    # Extract body content from nested structure
-    body_dict = typing.cast(Dict[str, JsonType], v1_response.get("body", {}))
-    storage_dict = typing.cast(Dict[str, JsonType], body_dict.get("storage", {}))
-    body_value = str(storage_dict.get("value", ""))
-    body_representation = str(storage_dict.get("representation", "storage"))
-
     # Extract version number
     version_dict = typing.cast(Dict[str, JsonType], v1_response.get("version", {}))
     version_number = int(version_dict.get("number", 1))
@@ -77,99 +96,98 @@ def map_page_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePage:
     author_id = str(created_by_dict.get("accountId", "unknown"))
 
     # v1 API returns dates in ISO format string
-    created_at_str = str(v1_response.get("createdDate", v1_response.get("created", datetime.datetime.now().isoformat())))
+    created_at_str = v1_response.get("createdDate", v1_response.get("created"))
     try:
-        # Parse ISO format datetime - handle both Z and +00:00 format
-        created_at = datetime.datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        created_at = _parse_iso_datetime(str(created_at_str)) if created_at_str is not None else datetime.datetime.now()
+    except ValueError:
         created_at = datetime.datetime.now()
 
-    # Build ConfluencePage object
-    # Note: v1 API doesn't provide parentType, position, ownerId, lastOwnerId
-    # These are set to None/placeholder values
-    return ConfluencePage(
+    return _PageCommon(
         id=page_id,
         spaceId=space_id,
         parentId=parent_id,
         status=status,
         title=title,
-        body=ConfluencePageBody(storage=ConfluencePageStorage(value=body_value, representation=body_representation)),
         version=ConfluenceContentVersion(number=version_number),
-        parentType=None,  # Not available in v1 API
-        position=None,  # Not available in v1 API
         authorId=author_id,
-        ownerId=author_id,  # Use author as owner (best guess for v1)
-        lastOwnerId=None,  # Not available in v1 API
         createdAt=created_at,
     )
 
 
-def map_page_properties_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePageProperties:
+def map_page_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePage:
     """
-    Convert Confluence REST API v1 page response to ConfluencePageProperties domain object.
+    Convert Confluence REST API v1 page response to ConfluencePage domain object.
 
-    This extracts only the properties (metadata) from a v1 page response, excluding body content.
+    The v1 API response structure differs from v2 in several ways:
+    - Uses nested structure for space (space.id instead of spaceId)
+    - Uses nested structure for body content (body.storage.value)
+    - Uses ancestors array instead of parentId
+    - Field names may differ (e.g., version structure)
 
     Args:
-        v1_response: JSON response from GET /rest/api/content/{id}?expand=version,space,history
+        v1_response: JSON response from GET /rest/api/content/{id}?expand=body.storage,version,space,history
 
     Returns:
-        ConfluencePageProperties object with mapped fields
+        ConfluencePage object with mapped fields
     """
-    import datetime
-    import typing
+    common = _extract_page_common(v1_response)
 
-    from .api import ConfluenceContentVersion
+    # Extract body content from nested structure
+    body_dict = typing.cast(Dict[str, JsonType], v1_response.get("body", {}))
+    storage_dict = typing.cast(Dict[str, JsonType], body_dict.get("storage", {}))
+    body_value = str(storage_dict.get("value", ""))
+    body_representation = str(storage_dict.get("representation", "storage"))
 
-    # Extract basic fields
-    page_id = str(v1_response["id"])
-    title = str(v1_response["title"])
-    status = str(v1_response["status"])
+    # Build ConfluencePage object
+    # Note: v1 API doesn't provide parentType, position, ownerId, lastOwnerId
+    # These are set to None/placeholder values
+    return ConfluencePage(
+        id=common.id,
+        spaceId=common.spaceId,
+        parentId=common.parentId,
+        status=common.status,
+        title=common.title,
+        body=ConfluencePageBody(storage=ConfluencePageStorage(value=body_value, representation=body_representation)),
+        version=common.version,
+        parentType=None,  # Not available in v1 API
+        position=None,  # Not available in v1 API
+        authorId=common.authorId,
+        ownerId=common.authorId,  # Use author as owner (best guess for v1)
+        lastOwnerId=None,  # Not available in v1 API
+        createdAt=common.createdAt,
+    )
 
-    # Extract space ID from nested structure
-    space_dict = typing.cast(Dict[str, JsonType], v1_response.get("space", {}))
-    space_id = str(space_dict["id"])
 
-    # Extract parentId from ancestors array (last element)
-    ancestors = typing.cast(list[JsonType], v1_response.get("ancestors", []))
-    parent_id = None
-    if ancestors:
-        last_ancestor = typing.cast(Dict[str, JsonType], ancestors[-1])
-        parent_id = str(last_ancestor["id"])
+def map_page_properties_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluencePageProperties:
+    """
+    Convert Confluence REST API v1 page response to ConfluencePageProperties domain object.
 
-    # Extract version number
-    version_dict = typing.cast(Dict[str, JsonType], v1_response.get("version", {}))
-    version_number = int(version_dict.get("number", 1))
+    This extracts only the properties (metadata) from a v1 page response, excluding body content.
 
-    # Extract history data if available
-    history_dict = typing.cast(Dict[str, JsonType], v1_response.get("history", {}))
-    created_by_dict = typing.cast(Dict[str, JsonType], history_dict.get("createdBy", {}))
-    author_id = str(created_by_dict.get("accountId", "unknown"))
+    Args:
+        v1_response: JSON response from GET /rest/api/content/{id}?expand=version,space,history
 
-    # v1 API returns dates in ISO format string
-    created_at_str = str(v1_response.get("createdDate", v1_response.get("created", datetime.datetime.now().isoformat())))
-    try:
-        # Parse ISO format datetime - handle both Z and +00:00 format
-        created_at = datetime.datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        created_at = datetime.datetime.now()
+    Returns:
+        ConfluencePageProperties object with mapped fields
+    """
+    common = _extract_page_common(v1_response)
 
     # Build ConfluencePageProperties object
     # Note: v1 API doesn't provide parentType, position, ownerId, lastOwnerId
     # These are set to None/placeholder values
     return ConfluencePageProperties(
-        id=page_id,
-        spaceId=space_id,
-        parentId=parent_id,
-        status=status,
-        title=title,
-        version=ConfluenceContentVersion(number=version_number),
+        id=common.id,
+        spaceId=common.spaceId,
+        parentId=common.parentId,
+        status=common.status,
+        title=common.title,
+        version=common.version,
         parentType=None,  # Not available in v1 API
         position=None,  # Not available in v1 API
-        authorId=author_id,
-        ownerId=author_id,  # Use author as owner (best guess for v1)
+        authorId=common.authorId,
+        ownerId=common.authorId,  # Use author as owner (best guess for v1)
         lastOwnerId=None,  # Not available in v1 API
-        createdAt=created_at,
+        createdAt=common.createdAt,
     )
 
 
@@ -226,20 +244,21 @@ def map_update_page_to_v1(page_id: str, request: ConfluenceUpdatePageRequest, sp
     Returns:
         Dictionary formatted for v1 PUT /rest/api/content/{id}
     """
+    # `minorEdit` is a field of `ConfluenceContentVersion`, always present
+    version: Dict[str, JsonType] = {"number": request.version.number}
+    if request.version.minorEdit is not None:
+        version["minorEdit"] = request.version.minorEdit
+
     v1_request: Dict[str, JsonType] = {
         "id": page_id,
         "type": "page",
         "title": request.title,
         "space": {"key": space_key},
         "body": {"storage": {"value": request.body.storage.value, "representation": "storage"}},
-        "version": {"number": request.version.number},
+        "version": version,
         "status": request.status.value,  # Convert enum to string value
     }
 
-    # Add minorEdit if provided
-    if hasattr(request.version, "minorEdit") and request.version.minorEdit is not None:
-        v1_request["version"]["minorEdit"] = request.version.minorEdit  # type: ignore
-
     return v1_request
 
 
@@ -271,11 +290,6 @@ def map_attachment_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluenceA
     Returns:
         ConfluenceAttachment object with mapped fields
     """
-    import datetime
-    import typing
-
-    from .api import ConfluenceAttachment, ConfluenceContentVersion, ConfluenceStatus
-
     # Extract basic fields
     attachment_id = str(v1_response["id"])
     title = str(v1_response["title"])
@@ -310,7 +324,7 @@ def map_attachment_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluenceA
     history = typing.cast(Dict[str, JsonType], v1_response.get("history", {}))
     created_date_str = str(history.get("createdDate", version_dict.get("when", "")))
     if created_date_str:
-        created_at = datetime.datetime.fromisoformat(created_date_str.replace("Z", "+00:00"))
+        created_at = _parse_iso_datetime(created_date_str)
     else:
         created_at = datetime.datetime.now(datetime.timezone.utc)
 
@@ -347,8 +361,6 @@ def map_label_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluenceIdenti
     Returns:
         ConfluenceIdentifiedLabel object with mapped fields
     """
-    from .api import ConfluenceIdentifiedLabel
-
     # Extract label fields
     label_id = str(v1_response["id"])
     name = str(v1_response["name"])
@@ -373,10 +385,6 @@ def map_property_v1_to_domain(v1_response: Dict[str, JsonType]) -> ConfluenceIde
     Returns:
         ConfluenceIdentifiedContentProperty object with mapped fields
     """
-    import typing
-
-    from .api import ConfluenceContentVersion
-
     # Extract property fields
     property_id = str(v1_response["id"])
     key = str(v1_response["key"])
@@ -2205,10 +2205,13 @@ class ConfluenceDocument:
         page_metadata: ConfluencePageCollection,
         kroki_server: Optional[KrokiServer] = None,
         user_metadata: Optional[ConfluenceUserCollection] = None,
+        document: Optional[ScannedDocument] = None,
     ) -> tuple[ConfluencePageID, "ConfluenceDocument"]:
         path = path.resolve(True)
 
-        document = Scanner().read(path)
+        # a document already scanned by the caller is used as is; otherwise, it is read from disk
+        if document is None:
+            document = Scanner().read(path)
 
         if document.page_id is not None:
             page_id = ConfluencePageID(document.page_id)
@@ -62,6 +62,10 @@ def _validate_base_path(base_path: Optional[str]) -> Optional[str]:
     return base_path
 
 
+_DEPLOYMENT_TYPES: dict[str, Literal["cloud", "datacenter", "server"]] = {"cloud": "cloud", "datacenter": "datacenter", "server": "server"}
+"Maps the lowercase spelling of each recognized deployment type to its canonical (interned) string constant."
+
+
 @overload
 def _validate_deployment_type(deployment_type: str) -> Literal["cloud", "datacenter", "server"]: ...
 
@@ -74,11 +78,11 @@ def _validate_deployment_type(deployment_type: Optional[str]) -> Optional[Litera
     if deployment_type is None:
         return None
 
-    deployment_type_lower = deployment_type.lower()
-    if deployment_type_lower not in ("cloud", "datacenter", "server"):
+    canonical = _DEPLOYMENT_TYPES.get(deployment_type.lower())
+    if canonical is None:
         raise ArgumentError(f"Invalid deployment type '{deployment_type}'; must be one of: 'cloud', 'datacenter', 'server'")
 
-    return deployment_type_lower  # type: ignore
+    return canonical
 
 
 class ConfluenceSiteProperties:
@@ -13,6 +13,11 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override as override  # noqa: F401
 
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: dict[str, bool] = {"slots": True}
+else:
+    DATACLASS_SLOTS: dict[str, bool] = {}
+
 if sys.version_info >= (3, 12):
     from pathlib import Path
 
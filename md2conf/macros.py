@@ -16,6 +16,9 @@ from typing import Callable, Optional
 
 LOGGER = logging.getLogger(__name__)
 
+# a macro invocation in an HTML comment: `<!-- macro:name: parameters -->`
+_MACRO = re.compile(r"<!--\s*macro:(\w+):\s*(.*?)\s*-->")
+
 
 @dataclass
 class MacroContext:
@@ -64,26 +67,73 @@ class MacroExpander:
 
     def expand(self, text: str, context: Optional[MacroContext] = None) -> str:
         """Expand all macro comments in text."""
-        pattern = r"<!--\s*macro:(\w+):\s*(.*?)\s*-->"
 
-        def replace_macro(match: re.Match[str]) -> str:
-            macro_name = match.group(1)
-            params = match.group(2).strip()
+        # most documents have no macros; a substring test is far cheaper than a regular expression scan
+        if "macro:" not in text:
+            return text
+
+        parts: list[str] = []
+        last = 0
+        for match in _MACRO.finditer(text):
+            parts.append(text[last : match.start()])
+            parts.append(self._expand_macro(match, context))
+            last = match.end()
+
+        # no macro invocation (only an unrelated occurrence of the marker text)
+        if not parts:
+            return text
+
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _expand_macro(self, match: re.Match[str], context: Optional[MacroContext]) -> str:
+        """Expand a single macro invocation, or return its original text if the macro is unknown or fails."""
+
+        macro_name = match.group(1)
+        expander = self.registry.get(macro_name)
+        if expander is None:
+            # Unknown macro - leave as is
+            return match.group(0)
+
+        params = match.group(2).strip()
+        try:
+            if macro_name in self.contextual:
+                return expander(params, context)
+            return expander(params)
+        except Exception:
+            # Return original text if expansion fails
+            LOGGER.warning("macro `%s` failed to expand; leaving invocation unchanged", macro_name, exc_info=True)
+            return match.group(0)
+
+
+def _split_parameters(params: str) -> list[str]:
+    """
+    Split a parameter string at each comma followed by an even number of double quote characters.
+
+    For balanced quotes, these are the commas outside quoted strings. Segments between quote characters are inspected in
+    alternation, so the string is scanned a constant number of times rather than once for each comma.
+    """
 
-            if macro_name in self.registry:
-                try:
-                    if macro_name in self.contextual:
-                        return self.registry[macro_name](params, context)
-                    return self.registry[macro_name](params)
-                except Exception:
-                    # Return original text if expansion fails
-                    LOGGER.warning("macro `%s` failed to expand; leaving invocation unchanged", macro_name, exc_info=True)
-                    return match.group(0)
-            else:
-                # Unknown macro - leave as is
-                return match.group(0)
+    segments = params.split('"')
+    # a comma in segment `k` is preceded by `k` quotes; it is a separator if the quotes that follow it are even in number
+    parity = (len(segments) - 1) % 2
+    parts: list[str] = []
+    current: list[str] = []
+    for index, segment in enumerate(segments):
+        if index:
+            current.append('"')
+        if index % 2 != parity:
+            current.append(segment)
+            continue
 
-        return re.sub(pattern, replace_macro, text)
+        first, *rest = segment.split(",")
+        current.append(first)
+        for piece in rest:
+            parts.append("".join(current))
+            current = [piece]
+
+    parts.append("".join(current))
+    return parts
 
 
 def parse_parameters(params: str) -> tuple[list[str], dict[str, str]]:
@@ -100,16 +150,14 @@ def parse_parameters(params: str) -> tuple[list[str], dict[str, str]]:
     named = {}
 
     # Split by comma, but respect quotes
-    parts = re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', params)
+    parts = _split_parameters(params)
 
     for part in parts:
         part = part.strip()
-        if "=" in part:
+        key, sep, value = part.partition("=")
+        if sep:
             # Named parameter
-            key, value = part.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            named[key] = value
+            named[key.strip()] = value.strip().strip('"').strip("'")
         else:
             # Positional parameter
             positional.append(part.strip('"').strip("'"))
@@ -134,13 +182,8 @@ def expand_jira_macro(params: str) -> str:
     key = positional[0]
     show_summary = named.get("showSummary", "false")
 
-    csf = '<ac:structured-macro ac:name="jira" ac:schema-version="1">'
-    csf += f'<ac:parameter ac:name="key">{key}</ac:parameter>'
-
-    if show_summary.lower() == "true":
-        csf += '<ac:parameter ac:name="showSummary">true</ac:parameter>'
-
-    csf += "</ac:structured-macro>"
+    summary = '<ac:parameter ac:name="showSummary">true</ac:parameter>' if show_summary.lower() == "true" else ""
+    csf = f'<ac:structured-macro ac:name="jira" ac:schema-version="1"><ac:parameter ac:name="key">{key}</ac:parameter>{summary}</ac:structured-macro>'
 
     return f"<!-- csf: {csf} -->"
 
@@ -174,10 +217,12 @@ def expand_status_macro(params: str) -> str:
     # Capitalize color for Confluence (Green, Red, etc.)
     color = color.capitalize()
 
-    csf = '<ac:structured-macro ac:name="status" ac:schema-version="1">'
-    csf += f'<ac:parameter ac:name="colour">{color}</ac:parameter>'
-    csf += f'<ac:parameter ac:name="title">{title}</ac:parameter>'
-    csf += "</ac:structured-macro>"
+    csf = (
+        '<ac:structured-macro ac:name="status" ac:schema-version="1">'
+        f'<ac:parameter ac:name="colour">{color}</ac:parameter>'
+        f'<ac:parameter ac:name="title">{title}</ac:parameter>'
+        "</ac:structured-macro>"
+    )
 
     return f"<!-- csf: {csf} -->"
 
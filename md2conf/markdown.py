@@ -6,11 +6,22 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import re
+import threading
 import xml.etree.ElementTree
 from typing import Any, Optional
 
 import markdown
 
+# opening or closing line of a fenced code block, with its indentation
+_FENCE_RE = re.compile(r"^(\s*)(`{3,}|~{3,})")
+
+# top-level list item (indented at most 3 spaces) with its indentation; markers are `-`, `*`, `+`, or a number followed by `.` or `)`
+_LIST_RE = re.compile(r"^(\s{0,3})([-*+]|\d+[.)])\s")
+
+# matches wherever `_LIST_RE` matches some line of a document (and possibly elsewhere, as `\s` spans line breaks)
+_LIST_ANY_RE = re.compile(_LIST_RE.pattern, re.MULTILINE)
+
 
 def _emoji_generator(
     index: str,
@@ -69,43 +80,60 @@ def _verbatim_formatter(
     return f"<div{html_id}{html_class}{html_attrs}>{source}</div>"
 
 
-_CONVERTER = markdown.Markdown(
-    extensions=[
-        "admonition",
-        "footnotes",
-        "markdown.extensions.tables",
-        "md_in_html",
-        "pymdownx.arithmatex",
-        "pymdownx.caret",
-        "pymdownx.emoji",
-        "pymdownx.highlight",  # required by `pymdownx.superfences`
-        "pymdownx.magiclink",
-        "pymdownx.mark",
-        "pymdownx.superfences",
-        "pymdownx.tilde",
-        "sane_lists",
-    ],
-    extension_configs={
-        "footnotes": {"BACKLINK_TITLE": ""},
-        "pymdownx.arithmatex": {
-            "generic": True,
-            "preview": False,
-            "tex_inline_wrap": ["\\(", "\\)"],
-            "tex_block_wrap": ["\\[", "\\]"],
-            "smart_dollar": False,  # Disable $...$ detection to avoid conflicts with bash variables
-        },
-        "pymdownx.emoji": {"emoji_generator": _emoji_generator},
-        "pymdownx.highlight": {
-            "use_pygments": False,
+def _create_converter() -> markdown.Markdown:
+    "Creates a Markdown converter with the extensions used by md2conf."
+
+    return markdown.Markdown(
+        extensions=[
+            "admonition",
+            "footnotes",
+            "markdown.extensions.tables",
+            "md_in_html",
+            "pymdownx.arithmatex",
+            "pymdownx.caret",
+            "pymdownx.emoji",
+            "pymdownx.highlight",  # required by `pymdownx.superfences`
+            "pymdownx.magiclink",
+            "pymdownx.mark",
+            "pymdownx.superfences",
+            "pymdownx.tilde",
+            "sane_lists",
+        ],
+        extension_configs={
+            "footnotes": {"BACKLINK_TITLE": ""},
+            "pymdownx.arithmatex": {
+                "generic": True,
+                "preview": False,
+                "tex_inline_wrap": ["\\(", "\\)"],
+                "tex_block_wrap": ["\\[", "\\]"],
+                "smart_dollar": False,  # Disable $...$ detection to avoid conflicts with bash variables
+            },
+            "pymdownx.emoji": {"emoji_generator": _emoji_generator},
+            "pymdownx.highlight": {
+                "use_pygments": False,
+            },
+            "pymdownx.superfences": {
+                "custom_fences": [
+                    {"name": "math", "class": "arithmatex", "format": _verbatim_formatter},
+                    {"name": "csf", "class": "csf", "format": _verbatim_formatter},
+                ]
+            },
         },
-        "pymdownx.superfences": {
-            "custom_fences": [
-                {"name": "math", "class": "arithmatex", "format": _verbatim_formatter},
-                {"name": "csf", "class": "csf", "format": _verbatim_formatter},
-            ]
-        },
-    },
-)
+    )
+
+
+_LOCAL = threading.local()
+"Per-thread state; a `markdown.Markdown` instance keeps conversion state and must not be shared between threads."
+
+
+def _get_converter() -> markdown.Markdown:
+    "Returns the Markdown converter of the current thread, creating it on first use."
+
+    converter: Optional[markdown.Markdown] = getattr(_LOCAL, "converter", None)
+    if converter is None:
+        converter = _create_converter()
+        _LOCAL.converter = converter
+    return converter
 
 
 def _preprocess_lists(content: str) -> str:
@@ -120,17 +148,24 @@ def _preprocess_lists(content: str) -> str:
     :param content: Markdown input as a string.
     :returns: Preprocessed markdown with blank lines added before lists.
     """
-    import re
+
+    # a document without list items needs no blank lines inserted
+    if not _LIST_ANY_RE.search(content):
+        return content
 
     lines = content.split("\n")
-    result = []
+    breaks: list[int] = []  # indices of lines to be preceded by a blank line
     in_code_block = False
     code_block_indent = 0
 
+    # list marker match of the previous line, carried over to avoid matching each line twice; fence lines never match, and
+    # a line inside a code block is only ever followed by another such line or by a fence, so both are recorded as `None`
+    prev_is_list: Optional[re.Match[str]] = None
+
     for i, line in enumerate(lines):
         # Track code block state (fenced code blocks with ``` or ~~~)
         # Need to handle both top-level and indented code blocks
-        fence_match = re.match(r"^(\s*)(`{3,}|~{3,})", line)
+        fence_match = _FENCE_RE.match(line)
         if fence_match:
             if not in_code_block:
                 # Starting a code block
@@ -140,17 +175,17 @@ def _preprocess_lists(content: str) -> str:
                 # Ending a code block (same indentation level)
                 in_code_block = False
                 code_block_indent = 0
-            result.append(line)
+            prev_is_list = None
             continue
 
         # Skip processing inside code blocks
         if in_code_block:
-            result.append(line)
+            prev_is_list = None
             continue
 
         # Check if current line starts a list AT TOP LEVEL (not indented more than 3 spaces)
         # List markers: -, *, +, or numbers followed by . or )
-        is_list_start = re.match(r"^(\s{0,3})([-*+]|\d+[.)])\s", line)
+        is_list_start = _LIST_RE.match(line)
 
         if is_list_start and i > 0:
             prev_line = lines[i - 1]
@@ -160,15 +195,23 @@ def _preprocess_lists(content: str) -> str:
             # 1. Previous line is non-blank
             # 2. Previous line is not a list item at same or less indentation
             # 3. Current line is at top level (indent <= 3)
-            prev_is_list = re.match(r"^(\s{0,3})([-*+]|\d+[.)])\s", prev_line)
-
             if prev_line.strip() and (not prev_is_list or len(prev_is_list.group(1)) > indent) and indent <= 3:
                 # Add blank line before this list
-                result.append("")
+                breaks.append(i)
+
+        prev_is_list = is_list_start
 
-        result.append(line)
+    # most documents need no change; otherwise copy runs of lines between insertion points
+    if not breaks:
+        return content
 
-    return "\n".join(result)
+    parts: list[str] = []
+    start = 0
+    for index in breaks:
+        parts.append("\n".join(lines[start:index]))
+        start = index
+    parts.append("\n".join(lines[start:]))
+    return "\n\n".join(parts)
 
 
 def markdown_to_html(content: str) -> str:
@@ -183,6 +226,7 @@ def markdown_to_html(content: str) -> str:
     # Preprocess to add blank lines before lists (Python-Markdown requirement)
     content = _preprocess_lists(content)
 
-    _CONVERTER.reset()
-    html = _CONVERTER.convert(content)
+    converter = _get_converter()
+    converter.reset()
+    html = converter.convert(content)
     return html
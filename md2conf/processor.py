@@ -20,7 +20,7 @@ from .environment import ArgumentError, PageCollisionError
 from .kroki import KrokiServer
 from .matcher import DirectoryEntry, FileEntry, Matcher, MatcherOptions
 from .metadata import ConfluenceSiteMetadata
-from .scanner import Scanner
+from .scanner import ScannedDocument, Scanner
 from .text import user_references
 
 LOGGER = logging.getLogger(__name__)
@@ -103,6 +103,9 @@ class Processor:
         self.page_metadata = ConfluencePageCollection()
         self.user_metadata: ConfluenceUserCollection = ConfluenceUserCollection()
 
+        # documents scanned while indexing, handed over to conversion (and dropped when a file is rewritten); kept for a single run only
+        self._scanned: dict[Path, ScannedDocument] = {}
+
     def process_directory(self, local_dir: Path) -> None:
         """
         Recursively scans a directory hierarchy for Markdown files, and processes each, resolving cross-references.
@@ -111,11 +114,14 @@ class Processor:
         local_dir = local_dir.resolve(True)
         LOGGER.info("Processing directory: %s", local_dir)
 
-        # build index of all Markdown files in directory hierarchy
-        root = self._index_directory(local_dir, None)
-        LOGGER.info("Indexed %d document(s)", root.count())
+        try:
+            # build index of all Markdown files in directory hierarchy
+            root = self._index_directory(local_dir, None)
+            LOGGER.info("Indexed %d document(s)", root.count())
 
-        self._process_items(root)
+            self._process_items(root)
+        finally:
+            self._scanned.clear()
 
     def process_page(self, path: Path) -> None:
         """
@@ -123,9 +129,12 @@ class Processor:
         """
 
         LOGGER.info("Processing page: %s", path)
-        root = self._index_file(path)
+        try:
+            root = self._index_file(path)
 
-        self._process_items(root)
+            self._process_items(root)
+        finally:
+            self._scanned.clear()
 
     @staticmethod
     def _assert_unique_page_ids(root: DocumentNode) -> None:
@@ -184,7 +193,14 @@ class Processor:
         """
 
         page_id, document = ConfluenceDocument.create(
-            path, self.options, self.root_dir, self.site, self.page_metadata, kroki_server=self.kroki_server, user_metadata=self.user_metadata
+            path,
+            self.options,
+            self.root_dir,
+            self.site,
+            self.page_metadata,
+            kroki_server=self.kroki_server,
+            user_metadata=self.user_metadata,
+            document=self._scanned.pop(path, None),
         )
         self._update_page(page_id, document, path)
 
@@ -295,6 +311,7 @@ class Processor:
 
         # extract information from a Markdown document found in a local directory.
         document = Scanner().read(path)
+        self._scanned[path] = document
 
         return DocumentNode(
             absolute_path=path,
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 from .ancestry import AncestryResolver
-from .api import ConfluenceContentProperty, ConfluenceLabel, ConfluencePageProperties, ConfluenceSession, ConfluenceStatus
+from .api import ConfluenceAttachmentUpload, ConfluenceContentProperty, ConfluenceLabel, ConfluencePageProperties, ConfluenceSession, ConfluenceStatus
 from .collection import ConfluenceUserCollection
 from .converter import ConfluenceDocument, attachment_name, get_volatile_attributes, get_volatile_elements
 from .csf import AC_ATTR, elements_from_string
@@ -147,16 +147,16 @@ class SynchronizingProcessor(Processor):
             found_id = self.api.page_exists(title, space_id=parent_page.spaceId)
 
             if found_id is not None:
+                # page properties carry the status; the page body is fetched later only if the page needs updating
                 properties = self.api.get_page_properties(found_id)
                 self._assert_owned(found_id, properties.title, managed_root_id, node.absolute_path)
 
-                found_page = self.api.get_page(found_id)
-                if found_page.status is ConfluenceStatus.ARCHIVED:
+                if properties.status is ConfluenceStatus.ARCHIVED:
                     # user has archived a page with this (auto-generated) title
-                    raise PageError(f"unable to update archived page with ID {found_page.id}")
+                    raise PageError(f"unable to update archived page with ID {properties.id}")
 
                 self._reparent_if_needed(node, properties, parent_id, is_root=is_root)
-                page = found_page
+                page = properties
             else:
                 LOGGER.debug("Creating new page with title: %s", title)
                 page = self.api.create_page(parent_id.page_id, title, "")
@@ -289,22 +289,27 @@ class SynchronizingProcessor(Processor):
         """
 
         base_path = path.parent
+        attachments: list[ConfluenceAttachmentUpload] = []
         for image_data in document.images:
-            self.api.upload_attachment(
-                page_id.page_id,
-                attachment_name(path_relative_to(image_data.path, base_path)),
-                attachment_path=image_data.path,
-                comment=image_data.description,
+            attachments.append(
+                ConfluenceAttachmentUpload(
+                    attachment_name(path_relative_to(image_data.path, base_path)),
+                    attachment_path=image_data.path,
+                    comment=image_data.description,
+                )
             )
 
         for name, file_data in document.embedded_files.items():
-            self.api.upload_attachment(
-                page_id.page_id,
-                name,
-                raw_data=file_data.data,
-                comment=file_data.description,
+            attachments.append(
+                ConfluenceAttachmentUpload(
+                    name,
+                    raw_data=file_data.data,
+                    comment=file_data.description,
+                )
             )
 
+        self.api.upload_attachments(page_id.page_id, attachments)
+
         content = document.xhtml()
         LOGGER.debug("Generated Confluence Storage Format document:\n%s", content)
 
@@ -376,6 +381,9 @@ class SynchronizingProcessor(Processor):
         with open(path, "w", encoding="utf-8") as file:
             file.write("\n".join(content))
 
+        # the document scanned while indexing no longer matches the file
+        self._scanned.pop(path, None)
+
 
 class SynchronizingProcessorFactory(ProcessorFactory):
     api: ConfluenceSession
@@ -21,11 +21,18 @@ from .mermaid import MermaidConfigProperties
 
 LOGGER = logging.getLogger(__name__)
 
+# prefer the libyaml-based parser if PyYAML has been built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 T = TypeVar("T")
 
-_PAGE_ID_RE = r"<!--\s+confluence[-_]page[-_]id:\s*(\d+)\s+-->"
-_SPACE_KEY_RE = r"<!--\s+confluence[-_]space[-_]key:\s*(\S+)\s+-->"
-_GENERATED_BY_RE = r"<!--\s+generated[-_]by:\s*(.*)\s+-->"
+_PAGE_ID_RE = re.compile(r"<!--\s+confluence[-_]page[-_]id:\s*(\d+)\s+-->", re.ASCII)
+_SPACE_KEY_RE = re.compile(r"<!--\s+confluence[-_]space[-_]key:\s*(\S+)\s+-->", re.ASCII)
+_GENERATED_BY_RE = re.compile(r"<!--\s+generated[-_]by:\s*(.*)\s+-->", re.ASCII)
+_METADATA_COMMENT_RE = re.compile(r"<!--\s+(?:confluence[-_]page[-_]id|confluence[-_]space[-_]key|generated[-_]by):", re.ASCII)
 
 
 def _json_to_object(
@@ -35,22 +42,36 @@ def _json_to_object(
     return json_to_object(typ, data, options=DeserializerOptions(skip_unassigned=True))
 
 
-def extract_value(pattern: str, text: str) -> tuple[Optional[str], str]:
-    values: list[str] = []
+def extract_value(pattern: re.Pattern[str], text: str) -> tuple[Optional[str], str]:
+    "Extracts the first capture group of the first match of a pattern, and removes the match from the text."
 
-    def _repl_func(matchobj: re.Match[str]) -> str:
-        values.append(matchobj.group(1))
-        return ""
+    match = pattern.search(text)
+    if match is None:
+        return None, text
 
-    text = re.sub(pattern, _repl_func, text, count=1, flags=re.ASCII)
-    value = values[0] if values else None
-    return value, text
+    return match.group(1), text[: match.start()] + text[match.end() :]
 
 
 def extract_frontmatter_block(text: str) -> tuple[Optional[str], str]:
-    "Extracts the front-matter from a Markdown document as a blob of unparsed text."
+    """
+    Extracts the front-matter from a Markdown document as a blob of unparsed text.
+
+    Front-matter starts with a line `---` at the very beginning of the document, and ends with the next line that is exactly `---`.
+    The returned block includes the line breaks that follow the opening and precede the closing delimiter; the remaining text
+    starts with the line break after the closing delimiter.
+    """
 
-    return extract_value(r"(?ms)\A---$(.+?)^---$", text)
+    if not text.startswith("---\n"):
+        return None, text
+
+    end = text.find("\n---", 3)
+    while end >= 0:
+        after = end + 4
+        if after == len(text) or text[after] == "\n":
+            return text[3 : end + 1], text[after:]
+        end = text.find("\n---", end + 1)
+
+    return None, text
 
 
 def extract_frontmatter_properties(text: str) -> tuple[Optional[dict[str, JsonType]], str]:
@@ -60,7 +81,7 @@ def extract_frontmatter_properties(text: str) -> tuple[Optional[dict[str, JsonTy
 
     properties: Optional[dict[str, Any]] = None
     if block is not None:
-        data = yaml.safe_load(block)
+        data = yaml.load(block, Loader=_YamlLoader)
         if isinstance(data, dict):
             properties = typing.cast(dict[str, JsonType], data)
 
@@ -92,7 +113,17 @@ class SkillProperties:
     user_invocable: Optional[bool] = None
 
 
-_SKILL_KEYS = {"name", "description", "version", "allowed-tools", "argument-hint", "model", "disable-model-invocation", "user-invocable"}
+_SKILL_KEY_NAMES = {
+    "name": "name",
+    "description": "description",
+    "version": "version",
+    "allowed-tools": "allowed_tools",
+    "argument-hint": "argument_hint",
+    "model": "model",
+    "disable-model-invocation": "disable_model_invocation",
+    "user-invocable": "user_invocable",
+}
+"Maps front-matter keys that describe a skill to the corresponding field names of `SkillProperties`."
 
 
 def _extract_skill_properties(data: dict[str, JsonType]) -> Optional["SkillProperties"]:
@@ -105,7 +136,7 @@ def _extract_skill_properties(data: dict[str, JsonType]) -> Optional["SkillPrope
     if "description" not in data:
         return None
 
-    normalized = {k.replace("-", "_"): v for k, v in data.items() if k in _SKILL_KEYS}
+    normalized = {_SKILL_KEY_NAMES[k]: v for k, v in data.items() if k in _SKILL_KEY_NAMES}
     if not normalized:
         return None
 
@@ -178,14 +209,21 @@ class Scanner:
     def parse(self, text: str) -> ScannedDocument:
         """Extracts essential properties from a Markdown document string."""
 
-        # extract Confluence page ID
-        page_id, text = extract_value(_PAGE_ID_RE, text)
+        page_id: Optional[str] = None
+        space_key: Optional[str] = None
+        generated_by: Optional[str] = None
+
+        # comment-based metadata is rare; a single scan for the start of any of the metadata comments decides whether the
+        # individual (and text-altering) pattern scans are needed at all
+        if "<!--" in text and _METADATA_COMMENT_RE.search(text):
+            # extract Confluence page ID
+            page_id, text = extract_value(_PAGE_ID_RE, text)
 
-        # extract Confluence space key
-        space_key, text = extract_value(_SPACE_KEY_RE, text)
+            # extract Confluence space key
+            space_key, text = extract_value(_SPACE_KEY_RE, text)
 
-        # extract 'generated-by' tag text
-        generated_by, text = extract_value(_GENERATED_BY_RE, text)
+            # extract 'generated-by' tag text
+            generated_by, text = extract_value(_GENERATED_BY_RE, text)
 
         # track whether any comment-based metadata was found (for deprecation warning)
         has_comment_metadata = page_id is not None or space_key is not None or generated_by is not None
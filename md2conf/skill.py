@@ -6,6 +6,7 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -130,6 +131,18 @@ CONFLUENCE_SPACE_KEY='SPACE'
 - **Confluence Storage Format passthrough**: fenced code with `csf` language
 """
 
+_SKILL_DATA = (_SKILL_FRONTMATTER + _SKILL_BODY).encode("utf-8")
+"Contents of `SKILL.md`, encoded once; written with LF line endings on all platforms."
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cli_help() -> str:
+    "Returns the help text of the command-line interface; building the argument parser is done once per process."
+
+    from .__main__ import get_help
+
+    return get_help()
+
 
 def generate_skill(out_dir: Path) -> Path:
     """Generates a Claude Code skill directory for md2conf.
@@ -139,27 +152,19 @@ def generate_skill(out_dir: Path) -> Path:
     """
 
     skill_dir = out_dir / _SKILL_NAME
-    os.makedirs(skill_dir, exist_ok=True)
+    references_dir = skill_dir / "references"
+
+    # creates the skill directory as well
+    os.makedirs(references_dir, exist_ok=True)
 
     skill_md_path = skill_dir / "SKILL.md"
-    with open(skill_md_path, "w", encoding="utf-8") as f:
-        f.write(_SKILL_FRONTMATTER)
-        f.write(_SKILL_BODY)
+    skill_md_path.write_bytes(_SKILL_DATA)
 
     LOGGER.info("Generated skill '%s' at %s", _SKILL_NAME, skill_dir)
 
     # Write CLI reference to references/ subdirectory
-    references_dir = skill_dir / "references"
-    os.makedirs(references_dir, exist_ok=True)
-
     cli_ref_path = references_dir / "cli-help.md"
-    with open(cli_ref_path, "w", encoding="utf-8") as f:
-        from .__main__ import get_help
-
-        f.write("# md2conf CLI Reference\n\n")
-        f.write("```\n")
-        f.write(get_help())
-        f.write("```\n")
+    cli_ref_path.write_bytes(f"# md2conf CLI Reference\n\n```\n{_get_cli_help()}```\n".encode("utf-8"))
 
     LOGGER.info("Generated CLI reference at %s", cli_ref_path)
 
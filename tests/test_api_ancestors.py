@@ -11,18 +11,7 @@ import unittest.mock
 from typing import Any, Optional
 from unittest.mock import Mock
 
-import requests
-
-from tests.utility import make_session
-
-
-def _json_response(payload: dict[str, Any]) -> Mock:
-    response = Mock(spec=requests.Response)
-    response.status_code = 200
-    response.text = ""
-    response.json.return_value = payload
-    response.raise_for_status.return_value = None
-    return response
+from tests.utility import json_response, make_session
 
 
 def _v1_page(page_id: str, title: str, ancestors: list[str]) -> dict[str, Any]:
@@ -49,7 +38,7 @@ class TestV1AncestorExpansion(unittest.TestCase):
     def test_get_page_properties_v1_requests_ancestors(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response(_v1_page("300", "Child", ["100", "200"]))
+        transport.get.return_value = json_response(_v1_page("300", "Child", ["100", "200"]))
 
         properties = session.get_page_properties("300")
 
@@ -59,7 +48,7 @@ class TestV1AncestorExpansion(unittest.TestCase):
     def test_get_page_v1_requests_ancestors(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response(_v1_page("300", "Child", ["100", "200"]))
+        transport.get.return_value = json_response(_v1_page("300", "Child", ["100", "200"]))
 
         page = session.get_page("300")
 
@@ -71,14 +60,14 @@ class TestGetAncestorIds(unittest.TestCase):
     def test_v1_returns_full_chain_root_first(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response(_v1_page("300", "Child", ["100", "200"]))
+        transport.get.return_value = json_response(_v1_page("300", "Child", ["100", "200"]))
 
         self.assertEqual(session.get_ancestor_ids("300"), ["100", "200"])
 
     def test_v1_root_page_has_no_ancestors(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response(_v1_page("100", "Root", []))
+        transport.get.return_value = json_response(_v1_page("100", "Root", []))
 
         self.assertEqual(session.get_ancestor_ids("100"), [])
 
@@ -0,0 +1,114 @@
+"""
+Tests for uploading several attachments to a page.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import tempfile
+import threading
+import unittest
+import unittest.mock
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from md2conf.api import ConfluenceAttachmentUpload, _guess_content_type
+from md2conf.environment import ConfluenceError, PageError
+from tests.utility import json_response, make_session
+
+
+class TestUploadAttachments(unittest.TestCase):
+    def test_uploads_each_attachment(self) -> None:
+        session = make_session("cloud")
+        uploaded: list[str] = []
+        lock = threading.Lock()
+
+        def fake_upload(page_id: str, attachment_name: str, **kwargs: Any) -> None:
+            with lock:
+                uploaded.append(attachment_name)
+
+        attachments = [ConfluenceAttachmentUpload(f"figure_{i}.png", attachment_path=Path(f"figure/{i}.png")) for i in range(20)]
+        with unittest.mock.patch.object(session, "upload_attachment", side_effect=fake_upload):
+            session.upload_attachments("123", attachments)
+
+        self.assertCountEqual(uploaded, [attachment.name for attachment in attachments])
+
+    def test_duplicate_name_uploaded_once(self) -> None:
+        session = make_session("cloud")
+        attachments = [
+            ConfluenceAttachmentUpload("figure.png", attachment_path=Path("figure.png"), comment="first"),
+            ConfluenceAttachmentUpload("data.bin", raw_data=b"data"),
+            ConfluenceAttachmentUpload("figure.png", attachment_path=Path("figure.png"), comment="second"),
+        ]
+        with unittest.mock.patch.object(session, "upload_attachment") as upload:
+            session.upload_attachments("123", attachments)
+
+        self.assertEqual(upload.call_count, 2)
+        comments = {call.args[1]: call.kwargs["comment"] for call in upload.call_args_list}
+        self.assertEqual(comments, {"figure.png": "first", "data.bin": None})
+
+    def test_failure_propagates(self) -> None:
+        session = make_session("datacenter")
+        attachments = [ConfluenceAttachmentUpload("a.png", raw_data=b"a"), ConfluenceAttachmentUpload("b.png", raw_data=b"b")]
+        with unittest.mock.patch.object(session, "upload_attachment", side_effect=ConfluenceError("upload failed")):
+            with self.assertRaises(ConfluenceError):
+                session.upload_attachments("123", attachments)
+
+
+class TestUploadAttachmentTitle(unittest.TestCase):
+    def _upload(self, returned_title: str) -> Mock:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.post.return_value = json_response({"results": [{"id": "att1", "title": returned_title, "version": {"number": 1}}]})
+
+        with unittest.mock.patch.object(session, "get_attachment_by_name", side_effect=ConfluenceError("not found")):
+            with unittest.mock.patch.object(session, "_update_attachment") as update:
+                session.upload_attachment("123", "figure_diagram.png", raw_data=b"data")
+        return update
+
+    def test_matching_title_not_updated(self) -> None:
+        self._upload("figure_diagram.png").assert_not_called()
+
+    def test_truncated_title_updated(self) -> None:
+        self._upload("diagram.png").assert_called_once_with("123", "att1", 2, "figure_diagram.png")
+
+
+class TestUploadAttachmentFile(unittest.TestCase):
+    def test_missing_file_raises(self) -> None:
+        session = make_session("cloud")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(PageError):
+                session.upload_attachment("123", "missing.png", attachment_path=Path(temp_dir) / "missing.png")
+            with self.assertRaises(PageError):
+                session.upload_attachment("123", "directory.png", attachment_path=Path(temp_dir))
+
+    def test_same_size_skipped(self) -> None:
+        session = make_session("cloud")
+        transport: Mock = session.session  # type: ignore[assignment]
+        attachment = Mock()
+        attachment.fileSize = 4
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            attachment_path = Path(temp_dir) / "figure.png"
+            attachment_path.write_bytes(b"data")
+            with unittest.mock.patch.object(session, "get_attachment_by_name", return_value=attachment):
+                session.upload_attachment("123", "figure.png", attachment_path=attachment_path)
+
+        transport.post.assert_not_called()
+
+
+class TestGuessContentType(unittest.TestCase):
+    def test_known_extensions(self) -> None:
+        self.assertEqual(_guess_content_type(".png"), "image/png")
+        self.assertEqual(_guess_content_type(".mmd"), "text/vnd.mermaid")
+        self.assertEqual(_guess_content_type(".tar.gz"), "application/x-tar")
+
+    def test_unknown_extension(self) -> None:
+        self.assertEqual(_guess_content_type(""), "application/octet-stream")
+        self.assertEqual(_guess_content_type(".unknown"), "application/octet-stream")
+
+
+if __name__ == "__main__":
+    unittest.main()
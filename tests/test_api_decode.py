@@ -0,0 +1,48 @@
+"""
+Tests for decoding REST API responses into typed objects.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import datetime
+import unittest
+
+from strong_typing.core import JsonType
+from strong_typing.exception import JsonTypeError
+
+from md2conf.api import _DESERIALIZERS, ConfluenceContentVersion, ConfluenceIdentifiedLabel, _json_to_object
+
+
+class TestJsonToObject(unittest.TestCase):
+    def test_raw_object_returned_as_is(self) -> None:
+        data: JsonType = {"results": [{"id": "1"}], "size": 1}
+        self.assertIs(_json_to_object(dict[str, JsonType], data), data)
+
+    def test_raw_array_returned_as_is(self) -> None:
+        data: JsonType = [{"id": "1"}, 2, "three"]
+        self.assertIs(_json_to_object(list[JsonType], data), data)
+
+    def test_raw_type_mismatch_raises(self) -> None:
+        with self.assertRaises(JsonTypeError):
+            _json_to_object(dict[str, JsonType], [1, 2, 3])
+
+    def test_typed_object(self) -> None:
+        version = _json_to_object(ConfluenceContentVersion, {"number": 3, "createdAt": "2025-01-01T00:00:00Z", "unknown": True})
+        self.assertEqual(version.number, 3)
+        self.assertEqual(version.createdAt, datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc))
+
+    def test_typed_list(self) -> None:
+        labels = _json_to_object(list[ConfluenceIdentifiedLabel], [{"id": "1", "name": "a", "prefix": "global"}])
+        self.assertEqual(labels, [ConfluenceIdentifiedLabel(id="1", name="a", prefix="global")])
+
+    def test_parser_engine_reused(self) -> None:
+        _json_to_object(list[ConfluenceIdentifiedLabel], [])
+        engine = _DESERIALIZERS[list[ConfluenceIdentifiedLabel]]
+        _json_to_object(list[ConfluenceIdentifiedLabel], [{"id": "1", "name": "a", "prefix": "global"}])
+        self.assertIs(_DESERIALIZERS[list[ConfluenceIdentifiedLabel]], engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
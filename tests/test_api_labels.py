@@ -0,0 +1,59 @@
+"""
+Tests for page label operations.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import unittest
+import unittest.mock
+from unittest.mock import Mock
+
+from md2conf.api import ConfluenceIdentifiedLabel, ConfluenceLabel
+from tests.utility import empty_response, make_session
+
+
+class TestRemoveLabels(unittest.TestCase):
+    def test_removes_each_label(self) -> None:
+        session = make_session("cloud")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.delete.return_value = empty_response()
+
+        labels = [ConfluenceLabel(name=f"label-{i}", prefix="global") for i in range(3)]
+        session.remove_labels("123", labels)
+
+        urls = sorted(str(call.args[0]) for call in transport.delete.call_args_list)
+        self.assertEqual(
+            urls,
+            [f"https://example.com/wiki/rest/api/content/123/label?name=label-{i}" for i in range(3)],
+        )
+
+
+class TestUpdateLabels(unittest.TestCase):
+    def test_adds_and_removes_difference(self) -> None:
+        session = make_session("cloud")
+        existing = [ConfluenceIdentifiedLabel(id="1", name="keep", prefix="global"), ConfluenceIdentifiedLabel(id="2", name="stale", prefix="global")]
+        wanted = [ConfluenceLabel(name="keep", prefix="global"), ConfluenceLabel(name="fresh", prefix="global")]
+
+        with unittest.mock.patch.object(session, "get_labels", return_value=existing):
+            with unittest.mock.patch.object(session, "add_labels") as add, unittest.mock.patch.object(session, "remove_labels") as remove:
+                session.update_labels("123", wanted)
+
+        add.assert_called_once_with("123", [ConfluenceLabel(name="fresh", prefix="global")])
+        remove.assert_called_once_with("123", [ConfluenceLabel(name="stale", prefix="global")])
+
+    def test_keep_existing_skips_removal(self) -> None:
+        session = make_session("cloud")
+        existing = [ConfluenceIdentifiedLabel(id="2", name="stale", prefix="global")]
+
+        with unittest.mock.patch.object(session, "get_labels", return_value=existing):
+            with unittest.mock.patch.object(session, "add_labels") as add, unittest.mock.patch.object(session, "remove_labels") as remove:
+                session.update_labels("123", [], keep_existing=True)
+
+        add.assert_not_called()
+        remove.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,15 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import datetime
 import logging
 import unittest
 
+from strong_typing.core import JsonType
+
 from md2conf.api_mappers import (
     map_label_v1_to_domain,
+    map_page_properties_v1_to_domain,
     map_property_v1_to_domain,
     map_space_v1_to_id,
 )
@@ -25,7 +29,7 @@ logging.basicConfig(
 class TestSpaceMappers(TypedTestCase):
     def test_map_space_v1_to_id(self) -> None:
         """Test extracting space ID from v1 response"""
-        v1_response = {"id": "789", "key": "TEST", "name": "Test Space"}
+        v1_response: dict[str, JsonType] = {"id": "789", "key": "TEST", "name": "Test Space"}
 
         space_id = map_space_v1_to_id(v1_response)
 
@@ -35,7 +39,7 @@ class TestSpaceMappers(TypedTestCase):
 class TestLabelMappers(TypedTestCase):
     def test_map_label_v1_to_domain(self) -> None:
         """Test mapping v1 label response"""
-        v1_response = {"id": "label123", "name": "test-label", "prefix": "global"}
+        v1_response: dict[str, JsonType] = {"id": "label123", "name": "test-label", "prefix": "global"}
 
         label = map_label_v1_to_domain(v1_response)
 
@@ -45,7 +49,7 @@ class TestLabelMappers(TypedTestCase):
 
     def test_map_label_v1_default_prefix(self) -> None:
         """Test mapping v1 label with default prefix"""
-        v1_response = {"id": "label456", "name": "my-label"}
+        v1_response: dict[str, JsonType] = {"id": "label456", "name": "my-label"}
 
         label = map_label_v1_to_domain(v1_response)
 
@@ -55,7 +59,7 @@ class TestLabelMappers(TypedTestCase):
 class TestPropertyMappers(TypedTestCase):
     def test_map_property_v1_to_domain(self) -> None:
         """Test mapping v1 content property response"""
-        v1_response = {"id": "prop123", "key": "custom-property", "value": {"data": "test value", "count": 42}, "version": {"number": 3}}
+        v1_response: dict[str, JsonType] = {"id": "prop123", "key": "custom-property", "value": {"data": "test value", "count": 42}, "version": {"number": 3}}
 
         prop = map_property_v1_to_domain(v1_response)
 
@@ -67,7 +71,12 @@ class TestPropertyMappers(TypedTestCase):
 
     def test_map_property_v1_complex_value(self) -> None:
         """Test mapping v1 property with complex nested value"""
-        v1_response = {"id": "prop456", "key": "metadata", "value": {"nested": {"deeply": {"value": "test"}}, "array": [1, 2, 3]}, "version": {"number": 1}}
+        v1_response: dict[str, JsonType] = {
+            "id": "prop456",
+            "key": "metadata",
+            "value": {"nested": {"deeply": {"value": "test"}}, "array": [1, 2, 3]},
+            "version": {"number": 1},
+        }
 
         prop = map_property_v1_to_domain(v1_response)
 
@@ -76,5 +85,23 @@ class TestPropertyMappers(TypedTestCase):
         self.assertIn("nested", prop.value)  # type: ignore
 
 
+class TestPageMappers(TypedTestCase):
+    def test_map_page_properties_v1_created_date(self) -> None:
+        """Test parsing the creation timestamp with the UTC designator"""
+        v1_response: dict[str, JsonType] = {
+            "id": "123",
+            "title": "Page",
+            "status": "current",
+            "space": {"id": "789"},
+            "version": {"number": 2},
+            "createdDate": "2025-01-01T12:30:00.000Z",
+        }
+
+        props = map_page_properties_v1_to_domain(v1_response)
+
+        self.assertEqual(props.createdAt, datetime.datetime(2025, 1, 1, 12, 30, tzinfo=datetime.timezone.utc))
+        self.assertEqual(props.version.number, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
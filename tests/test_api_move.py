@@ -6,11 +6,13 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import json
 import unittest
 from unittest.mock import Mock
 
 import requests
 
+from tests.utility import json_response
 from tests.utility import make_session as _make_session
 
 
@@ -21,6 +23,32 @@ def _http_error_response() -> Mock:
     return response
 
 
+class TestMovePageV1(unittest.TestCase):
+    def test_move_page_fetches_properties_only(self) -> None:
+        confluence = _make_session("datacenter")
+        transport: Mock = confluence.session  # type: ignore[assignment]
+        transport.get.return_value = json_response(
+            {
+                "id": "300",
+                "title": "Child",
+                "status": "current",
+                "space": {"id": "1", "key": "TEST"},
+                "version": {"number": 4},
+                "history": {"createdBy": {"accountId": "user"}},
+                "createdDate": "2026-01-01T00:00:00.000Z",
+                "ancestors": [{"id": "100"}],
+            }
+        )
+        transport.put.return_value = json_response({})
+
+        confluence.move_page("300", "200")
+
+        self.assertNotIn("body.storage", str(transport.get.call_args.args[0]))
+        request = json.loads(transport.put.call_args.kwargs["data"])
+        self.assertEqual(request["version"], {"number": 5})
+        self.assertEqual(request["ancestors"], [{"id": "200"}])
+
+
 class TestMovePageResilienceV1(unittest.TestCase):
     def test_move_before_sibling_swallows_http_error(self) -> None:
         confluence = _make_session("datacenter")
@@ -10,19 +10,8 @@ import unittest
 from typing import Any
 from unittest.mock import Mock
 
-import requests
-
 from md2conf.environment import PageCollisionError
-from tests.utility import make_session
-
-
-def _json_response(payload: dict[str, Any]) -> Mock:
-    response = Mock(spec=requests.Response)
-    response.status_code = 200
-    response.text = ""
-    response.json.return_value = payload
-    response.raise_for_status.return_value = None
-    return response
+from tests.utility import json_response, make_session
 
 
 def _v1_result(page_id: str, title: str) -> dict[str, Any]:
@@ -50,21 +39,21 @@ class TestPageExistsAmbiguityDataCenter(unittest.TestCase):
     def test_single_match_returns_id(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v1_result("300", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v1_result("300", "Guide")]})
 
         self.assertEqual(session.page_exists("Guide", space_key="TEST"), "300")
 
     def test_no_match_returns_none(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": []})
+        transport.get.return_value = json_response({"results": []})
 
         self.assertIsNone(session.page_exists("Guide", space_key="TEST"))
 
     def test_multiple_matches_raise_naming_ids(self) -> None:
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v1_result("300", "Guide"), _v1_result("400", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v1_result("300", "Guide"), _v1_result("400", "Guide")]})
 
         with self.assertRaises(PageCollisionError) as context:
             session.page_exists("Guide", space_key="TEST")
@@ -78,7 +67,7 @@ class TestPageExistsAmbiguityDataCenter(unittest.TestCase):
 
         session = make_session("datacenter")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v1_result("300", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v1_result("300", "Guide")]})
 
         session.page_exists("Guide", space_key="TEST")
 
@@ -89,21 +78,21 @@ class TestPageExistsAmbiguityCloud(unittest.TestCase):
     def test_single_match_returns_id(self) -> None:
         session = make_session("cloud")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v2_result("300", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v2_result("300", "Guide")]})
 
         self.assertEqual(session.page_exists("Guide", space_id="500"), "300")
 
     def test_no_match_returns_none(self) -> None:
         session = make_session("cloud")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": []})
+        transport.get.return_value = json_response({"results": []})
 
         self.assertIsNone(session.page_exists("Guide", space_id="500"))
 
     def test_multiple_matches_raise_naming_ids(self) -> None:
         session = make_session("cloud")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v2_result("300", "Guide"), _v2_result("400", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v2_result("300", "Guide"), _v2_result("400", "Guide")]})
 
         with self.assertRaises(PageCollisionError) as context:
             session.page_exists("Guide", space_id="500")
@@ -117,7 +106,7 @@ class TestPageExistsAmbiguityCloud(unittest.TestCase):
 
         session = make_session("cloud")
         transport: Mock = session.session  # type: ignore[assignment]
-        transport.get.return_value = _json_response({"results": [_v2_result("300", "Guide")]})
+        transport.get.return_value = json_response({"results": [_v2_result("300", "Guide")]})
 
         session.page_exists("Guide", space_id="500")
 
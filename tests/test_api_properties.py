@@ -0,0 +1,105 @@
+"""
+Tests for content property operations.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import unittest
+import unittest.mock
+from typing import Any
+from unittest.mock import Mock
+
+from md2conf.api import ConfluenceContentProperty, ConfluenceContentVersion, ConfluenceIdentifiedContentProperty
+from md2conf.environment import PageError
+from tests.utility import json_response, make_session
+
+
+def _v1_properties(*keys: str) -> dict[str, Any]:
+    results = [{"id": f"id-{key}", "key": key, "value": {}, "version": {"number": 1}} for key in keys]
+    return {"results": results, "size": len(results)}
+
+
+class TestContentPropertyKeyLookupV1(unittest.TestCase):
+    def test_remove_listed_properties_without_lookup(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response(_v1_properties("alpha", "beta"))
+        transport.delete.return_value = json_response(None)
+
+        session.get_content_properties_for_page("123")
+        session.remove_content_property_from_page("123", "id-alpha")
+        session.remove_content_property_from_page("123", "id-beta")
+
+        self.assertEqual(transport.get.call_count, 1)
+        urls = [str(call.args[0]) for call in transport.delete.call_args_list]
+        self.assertEqual(
+            urls,
+            [
+                "https://example.com/wiki/rest/api/content/123/property/alpha",
+                "https://example.com/wiki/rest/api/content/123/property/beta",
+            ],
+        )
+
+    def test_remove_unseen_property_looks_up_key(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response(_v1_properties("alpha"))
+        transport.delete.return_value = json_response(None)
+
+        session.remove_content_property_from_page("123", "id-alpha")
+
+        self.assertEqual(transport.get.call_count, 1)
+        self.assertEqual(str(transport.delete.call_args.args[0]), "https://example.com/wiki/rest/api/content/123/property/alpha")
+
+    def test_remove_missing_property_raises(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response(_v1_properties("alpha"))
+
+        with self.assertRaises(PageError):
+            session.remove_content_property_from_page("123", "id-missing")
+        transport.delete.assert_not_called()
+
+    def test_update_listed_property_without_lookup(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response(_v1_properties("alpha"))
+        transport.put.return_value = json_response({"id": "id-alpha", "key": "alpha", "value": {"data": 1}, "version": {"number": 2}})
+
+        properties = session.get_content_properties_for_page("123")
+        updated = session.update_content_property_for_page("123", "id-alpha", 2, ConfluenceContentProperty(key="alpha", value={"data": 1}))
+
+        self.assertEqual(len(properties), 1)
+        self.assertEqual(transport.get.call_count, 1)
+        self.assertEqual(str(transport.put.call_args.args[0]), "https://example.com/wiki/rest/api/content/123/property/alpha")
+        self.assertEqual(updated.version.number, 2)
+
+
+class TestUpdateContentProperties(unittest.TestCase):
+    def test_adds_removes_and_updates(self) -> None:
+        session = make_session("cloud")
+        existing = [
+            ConfluenceIdentifiedContentProperty(id=f"id-{key}", key=key, value=value, version=ConfluenceContentVersion(number=3))
+            for key, value in [("same", 1), ("changed", 1), ("stale", 1)]
+        ]
+        wanted = [
+            ConfluenceContentProperty(key="same", value=1),
+            ConfluenceContentProperty(key="changed", value=2),
+            ConfluenceContentProperty(key="fresh", value=1),
+        ]
+
+        with unittest.mock.patch.object(session, "get_content_properties_for_page", return_value=existing):
+            with unittest.mock.patch.object(session, "add_content_property_to_page") as add:
+                with unittest.mock.patch.object(session, "remove_content_property_from_page") as remove:
+                    with unittest.mock.patch.object(session, "update_content_property_for_page") as update:
+                        session.update_content_properties_for_page("123", wanted)
+
+        add.assert_called_once_with("123", wanted[2])
+        remove.assert_called_once_with("123", "id-stale")
+        update.assert_called_once_with("123", "id-changed", 4, wanted[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
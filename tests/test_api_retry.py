@@ -6,12 +6,16 @@ Copyright 2022-2025, Levente Hunyadi
 :see: https://github.com/hunyadi/md2conf
 """
 
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import requests
 
-from md2conf.api import _retry_request
+from md2conf.api import CONNECT_RETRIES, MAX_RETRY_AFTER, ConfluenceAPI, TruststoreAdapter, _retry_request
+from md2conf.environment import ConfluenceConnectionProperties, ConfluenceError
+from tests.utility import make_session
 
 
 class TestRetryLogic(unittest.TestCase):
@@ -122,6 +126,47 @@ class TestRetryLogic(unittest.TestCase):
         self.assertAlmostEqual(delays[1], 2.5)
         self.assertAlmostEqual(delays[2], 4.5)
 
+    @patch("md2conf.api.time.sleep", return_value=None)
+    def test_honors_retry_after_seconds(self, mock_sleep: MagicMock) -> None:
+        """Should wait for the delay the server requests with the Retry-After header."""
+        throttled = self._make_response(429)
+        throttled.headers["Retry-After"] = "7"
+        func = MagicMock(side_effect=[throttled, self._make_response(200)])
+        response = _retry_request(func, "http://example.com")
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("md2conf.api.time.sleep", return_value=None)
+    def test_honors_retry_after_date(self, mock_sleep: MagicMock) -> None:
+        """Should accept an HTTP date in the Retry-After header, never waiting a negative amount."""
+        unavailable = self._make_response(503)
+        unavailable.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        func = MagicMock(side_effect=[unavailable, self._make_response(200)])
+        _retry_request(func, "http://example.com")
+        mock_sleep.assert_called_once_with(0.0)
+
+    @patch("md2conf.api.time.sleep", return_value=None)
+    def test_caps_retry_after(self, mock_sleep: MagicMock) -> None:
+        """Should wait no longer than the upper bound, however long the server asks to wait."""
+        for value in ("86400000", "inf", "Fri, 31 Dec 9999 23:59:59 GMT"):
+            with self.subTest(value=value):
+                mock_sleep.reset_mock()
+                throttled = self._make_response(429)
+                throttled.headers["Retry-After"] = value
+                func = MagicMock(side_effect=[throttled, self._make_response(200)])
+                _retry_request(func, "http://example.com")
+                mock_sleep.assert_called_once_with(MAX_RETRY_AFTER)
+
+    @patch("md2conf.api.time.sleep", return_value=None)
+    @patch("md2conf.api.random.uniform", return_value=0.5)
+    def test_ignores_malformed_retry_after(self, mock_uniform: MagicMock, mock_sleep: MagicMock) -> None:
+        """Should fall back to exponential backoff if the Retry-After header cannot be parsed."""
+        throttled = self._make_response(429)
+        throttled.headers["Retry-After"] = "soon"
+        func = MagicMock(side_effect=[throttled, self._make_response(200)])
+        _retry_request(func, "http://example.com", base_delay=1.0)
+        mock_sleep.assert_called_once_with(1.5)
+
     @patch("md2conf.api.time.sleep", return_value=None)
     def test_passes_kwargs_to_func(self, mock_sleep: MagicMock) -> None:
         """Should pass through all args and kwargs to the underlying function."""
@@ -130,5 +175,61 @@ class TestRetryLogic(unittest.TestCase):
         func.assert_called_once_with("http://example.com", headers={"Accept": "application/json"}, verify=True)
 
 
+class TestTransportRetry(unittest.TestCase):
+    """Tests for the retry policy of the HTTPS transport adapter."""
+
+    def test_retries_connection_errors_only(self) -> None:
+        """Should re-attempt failed connections, leaving status codes to _retry_request."""
+        properties = ConfluenceConnectionProperties(
+            domain="example.com",
+            base_path="/wiki/",
+            api_key="key",
+            space_key="TEST",
+            deployment_type="datacenter",
+        )
+        with ConfluenceAPI(properties) as api:
+            retries = api.session.get_adapter("https://example.com/").max_retries  # type: ignore[attr-defined]
+            self.assertEqual(retries.connect, CONNECT_RETRIES)
+            self.assertEqual(retries.read, 0)
+            self.assertEqual(retries.status, 0)
+
+    def test_adapters_share_ssl_context(self) -> None:
+        """Should load the trust store once, sharing the SSL context across adapters."""
+        first = TruststoreAdapter()
+        second = TruststoreAdapter()
+        self.assertIs(
+            first.poolmanager.connection_pool_kw["ssl_context"],
+            second.poolmanager.connection_pool_kw["ssl_context"],
+        )
+
+
+class TestUploadRetry(unittest.TestCase):
+    """Tests that a retried attachment upload sends the same content again."""
+
+    @patch("md2conf.api.time.sleep", return_value=None)
+    def test_retry_resends_file_content(self, mock_sleep: MagicMock) -> None:
+        throttled = requests.Response()
+        throttled.status_code = 503
+        created = requests.Response()
+        created.status_code = 200
+        created._content = b'{"results": [{"id": "att1", "version": {"number": 1}}]}'
+
+        session = make_session("datacenter")
+        transport: MagicMock = session.session  # type: ignore[assignment]
+        transport.post.side_effect = [throttled, created]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            attachment_path = Path(temp_dir) / "attachment.txt"
+            attachment_path.write_bytes(b"attachment content")
+
+            with patch.object(session, "get_attachment_by_name", side_effect=ConfluenceError("not found")), patch.object(session, "_update_attachment"):
+                session.upload_attachment("123", "attachment.txt", attachment_path=attachment_path)
+
+        self.assertEqual(transport.post.call_count, 2)
+        for call in transport.post.call_args_list:
+            _, content, _, _ = call.kwargs["files"]["file"]
+            self.assertEqual(content, b"attachment content")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for space key and space ID resolution.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from tests.utility import json_response, make_session
+
+
+class TestSpaceResolutionCache(unittest.TestCase):
+    def test_v1_key_to_id_fetched_once(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response({"id": 42, "key": "TEST"})
+
+        self.assertEqual(session.space_key_to_id("TEST"), "42")
+        self.assertEqual(session.space_key_to_id("TEST"), "42")
+        self.assertEqual(session.space_id_to_key("42"), "TEST")
+        self.assertEqual(transport.get.call_count, 1)
+
+    def test_v2_key_to_id_populates_reverse_cache(self) -> None:
+        session = make_session("cloud")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response({"results": [{"id": "42", "key": "TEST"}]})
+
+        self.assertEqual(session.space_key_to_id("TEST"), "42")
+        self.assertEqual(session.space_id_to_key("42"), "TEST")
+        self.assertEqual(transport.get.call_count, 1)
+
+    def test_v2_id_to_key_populates_reverse_cache(self) -> None:
+        session = make_session("cloud")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.get.return_value = json_response({"results": [{"id": "42", "key": "TEST"}]})
+
+        self.assertEqual(session.space_id_to_key("42"), "TEST")
+        self.assertEqual(session.space_key_to_id("TEST"), "42")
+        self.assertEqual(transport.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
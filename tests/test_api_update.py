@@ -0,0 +1,112 @@
+"""
+Tests for page updates in ConfluenceSession.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from md2conf.environment import ArgumentError
+from tests.utility import json_response, make_session
+
+
+class TestUpdatePage(unittest.TestCase):
+    def test_v1_returns_updated_page(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.put.return_value = json_response(
+            {
+                "id": "300",
+                "title": "Updated",
+                "status": "current",
+                "space": {"id": "1", "key": "TEST"},
+                "version": {"number": 5},
+                "ancestors": [{"id": "100"}],
+            }
+        )
+
+        page = session.update_page("300", "<p/>", title="Updated", version=5)
+
+        self.assertEqual(transport.put.call_count, 1)
+        transport.get.assert_not_called()
+        self.assertEqual(page.title, "Updated")
+        self.assertEqual(page.version.number, 5)
+        self.assertEqual(page.parentId, "100")
+
+    def test_v1_minimal_response(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.put.return_value = json_response({"id": "300", "type": "page", "version": {"number": 5}})
+        transport.get.return_value = json_response({"id": 1, "key": "TEST"})
+
+        page = session.update_page("300", "<p/>", title="Updated", version=5)
+
+        self.assertIn("expand=space%2Cversion", transport.put.call_args.args[0])
+        self.assertEqual(page.id, "300")
+        self.assertEqual(page.spaceId, "1")
+        self.assertEqual(page.title, "Updated")
+        self.assertEqual(page.version.number, 5)
+
+    def test_v1_requires_space_key(self) -> None:
+        session = make_session("datacenter")
+        session.site.space_key = None
+        transport: Mock = session.session  # type: ignore[assignment]
+
+        with self.assertRaises(ArgumentError):
+            session.update_page("300", "<p/>", title="Updated", version=5)
+        transport.put.assert_not_called()
+
+    def test_v1_body_is_compact_utf8(self) -> None:
+        session = make_session("datacenter")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.put.return_value = json_response(
+            {
+                "id": "300",
+                "title": "Árvíztűrő",
+                "status": "current",
+                "space": {"id": "1", "key": "TEST"},
+                "version": {"number": 2},
+            }
+        )
+
+        session.update_page("300", "<p>tükörfúrógép</p>", title="Árvíztűrő", version=2)
+
+        body: bytes = transport.put.call_args.kwargs["data"]
+        self.assertIn("<p>tükörfúrógép</p>".encode("utf-8"), body)
+        self.assertNotIn(b"\\u", body)
+        self.assertNotIn(b": ", body)
+
+    def test_v2_returns_updated_page(self) -> None:
+        session = make_session("cloud")
+        transport: Mock = session.session  # type: ignore[assignment]
+        transport.put.return_value = json_response(
+            {
+                "id": "300",
+                "status": "current",
+                "title": "Updated",
+                "spaceId": "1",
+                "parentId": "100",
+                "parentType": "page",
+                "position": 1,
+                "authorId": "author-1",
+                "ownerId": "owner-1",
+                "lastOwnerId": None,
+                "createdAt": "2025-01-01T00:00:00.000Z",
+                "version": {"number": 5, "minorEdit": True, "createdAt": "2025-01-02T00:00:00.000Z", "message": "", "authorId": "author-1"},
+                "body": {"storage": {"representation": "storage", "value": "<p/>"}},
+            }
+        )
+
+        page = session.update_page("300", "<p/>", title="Updated", version=5)
+
+        self.assertEqual(transport.put.call_count, 1)
+        transport.get.assert_not_called()
+        self.assertEqual(page.title, "Updated")
+        self.assertEqual(page.version.number, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
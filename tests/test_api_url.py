@@ -0,0 +1,37 @@
+"""
+Tests for building Confluence REST API URLs.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import unittest
+
+from md2conf.api import ConfluenceVersion
+from tests.utility import make_session
+
+
+class TestBuildURL(unittest.TestCase):
+    def test_url_without_query(self) -> None:
+        session = make_session("cloud")
+        self.assertEqual(
+            session._build_url(ConfluenceVersion.VERSION_2, "/pages/123"),
+            "https://example.com/wiki/api/v2/pages/123",
+        )
+
+    def test_url_with_query(self) -> None:
+        session = make_session("datacenter")
+        self.assertEqual(
+            session._build_url(ConfluenceVersion.VERSION_1, "/content", {"title": "A & B", "spaceKey": "TEST"}),
+            "https://example.com/wiki/rest/api/content?title=A+%26+B&spaceKey=TEST",
+        )
+
+    def test_api_url_with_query_rejected(self) -> None:
+        session = make_session("cloud")
+        with self.assertRaises(ValueError):
+            session.api_url = "https://example.com/wiki/?key=value"
+
+
+if __name__ == "__main__":
+    unittest.main()
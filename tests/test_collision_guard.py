@@ -175,11 +175,10 @@ class TestGuardStopsWritesEndToEnd(unittest.TestCase):
 
         processor, api = _processor({"100": [], "200": ["100"], "300": ["100", "200"]})
         processor.ancestry = AncestryResolver(api)
-        api.get_page_properties.side_effect = lambda page_id: _properties(page_id, "Child", "200")
-        api.page_exists.return_value = "300"  # in-tree, so the containment guard passes
         archived = _properties("300", "Child", "200")
         archived.status = ConfluenceStatus.ARCHIVED
-        api.get_page.return_value = archived
+        api.get_page_properties.side_effect = lambda page_id: archived if page_id == "300" else _properties(page_id, "Child", "200")
+        api.page_exists.return_value = "300"  # in-tree, so the containment guard passes
 
         node = DocumentNode(
             absolute_path=Path("/docs/a.md"),
@@ -313,7 +312,6 @@ class TestTitleBranchReparentsEndToEnd(unittest.TestCase):
         processor._update_markdown = Mock()  # type: ignore[method-assign]
         api.get_page_properties.side_effect = lambda page_id: _properties(page_id, f"Page {page_id}", "300" if page_id == "400" else "100")
         api.page_exists.return_value = "400"
-        api.get_page.return_value = _properties("400", "Child", "300")
         api.get_child_page_ids.return_value = []
 
         node = DocumentNode(
@@ -327,6 +325,7 @@ class TestTitleBranchReparentsEndToEnd(unittest.TestCase):
         processor._synchronize_subtree(node, ConfluencePageID("200"), "200", {}, is_root=False)
 
         api.move_page.assert_called_once_with("400", "200")
+        api.get_page.assert_not_called()  # page properties suffice for a title match
 
         # the ancestor cache must have been discarded, so a post-move question re-queries the API
         calls_after_move = api.get_ancestor_ids.call_count
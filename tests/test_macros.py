@@ -21,6 +21,7 @@ from md2conf.macros import (
     MacroExpander,
     expand_embed_html,
     expand_macros,
+    parse_parameters,
 )
 from tests.utility import TypedTestCase
 
@@ -442,9 +443,44 @@ class TestEmbedHtmlEndToEnd(TypedTestCase):
         self.assertIn("Explorer", xhtml)
 
 
+class TestParseParameters(TypedTestCase):
+    def test_positional_and_named(self) -> None:
+        positional, named = parse_parameters('PROJ-123, showSummary=true, title="a, b = c"')
+
+        self.assertListEqual(positional, ["PROJ-123"])
+        self.assertDictEqual(named, {"showSummary": "true", "title": "a, b = c"})
+
+    def test_split_agrees_with_lookahead_pattern(self) -> None:
+        "Splitting matches the regular expression it replaces, including unbalanced quotes."
+
+        pattern = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+        cases = [
+            "",
+            "a",
+            "a, b, c",
+            ",,",
+            'a, "b, c", d',
+            'k="x,y", z="1,2,3"',
+            '"a,b',
+            'a, b"c, d',
+            'a, "b", "c, d"e, f',
+            "'a, b', c",
+        ]
+        for params in cases:
+            with self.subTest(params=params):
+                self.assertListEqual(macros._split_parameters(params), pattern.split(params))
+
+
 class TestMacroExpanderContext(TypedTestCase):
     "Tests that contextual dispatch does not disturb existing one-argument expanders."
 
+    def test_text_without_macros_is_returned_as_is(self) -> None:
+        expander = MacroExpander()
+        text = "# Title\n\n<!-- a comment --> and plain text"
+
+        self.assertIs(expander.expand(text), text)
+        self.assertEqual(expander.expand("<!--macro:status: green, Done-->").count('ac:name="status"'), 1)
+
     def test_existing_one_argument_macros_still_expand(self) -> None:
         expander = MacroExpander()
         text = "<!-- macro:status: green, Done --> and <!-- macro:jira: PROJ-123 -->"
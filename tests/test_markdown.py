@@ -0,0 +1,36 @@
+"""
+Publish Markdown files to Confluence wiki.
+
+Copyright 2022-2025, Levente Hunyadi
+
+:see: https://github.com/hunyadi/md2conf
+"""
+
+import concurrent.futures
+import unittest
+
+from md2conf.markdown import _get_converter, markdown_to_html
+from tests.utility import TypedTestCase
+
+
+class TestMarkdown(TypedTestCase):
+    def test_converter_reused_within_thread(self) -> None:
+        self.assertIs(_get_converter(), _get_converter())
+
+    def test_converter_per_thread(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(_get_converter).result()
+        self.assertIsNot(other, _get_converter())
+
+    def test_concurrent_conversion(self) -> None:
+        documents = [f"# Heading {i}\n\nParagraph[^{i}]\n\n[^{i}]: Note {i}\n" for i in range(32)]
+        expected = [markdown_to_html(document) for document in documents]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(executor.map(markdown_to_html, documents))
+
+        self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
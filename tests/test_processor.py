@@ -59,6 +59,17 @@ class TestProcessor(TypedTestCase):
         self.assertTrue((self.out_dir / "code.csf").exists())
         self.assertFalse((self.sample_dir / "code.csf").exists())
 
+    def test_scanned_documents_released_after_run(self) -> None:
+        options = ConfluenceDocumentOptions(
+            root_page_id=ConfluencePageID("ROOT_PAGE_ID"),
+        )
+        site_metadata = ConfluenceSiteMetadata(domain="example.com", base_path="/wiki/", space_key="SPACE_KEY")
+        processor = LocalProcessor(options, site_metadata, out_dir=self.out_dir, root_dir=self.sample_dir)
+        processor.process_directory(self.sample_dir)
+
+        self.assertTrue((self.out_dir / "index.csf").exists())
+        self.assertDictEqual(processor._scanned, {})
+
     def test_content_sync_continues_when_order_sync_fails(self) -> None:
         options = ConfluenceDocumentOptions(
             root_page_id=ConfluencePageID("ROOT_PAGE_ID"),
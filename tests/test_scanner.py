@@ -5,12 +5,15 @@ Copyright 2022-2025, Levente Hunyadi
 """
 
 import logging
+import re
+import tempfile
 import unittest
+from pathlib import Path
 
 from strong_typing.exception import JsonTypeError
 
 from md2conf.extra import override
-from md2conf.scanner import MermaidScanner, Scanner
+from md2conf.scanner import MermaidScanner, Scanner, extract_frontmatter_block
 from tests.utility import TypedTestCase
 
 logging.basicConfig(
@@ -150,6 +153,38 @@ class TestScanner(TypedTestCase):
         with self.assertNoLogs("md2conf.scanner", level="WARNING"):
             Scanner().parse(frontmatter_only)
 
+    def test_frontmatter_block(self) -> None:
+        "Delimiter search agrees with the regular expression `\\A---$(.+?)^---$` it replaces."
+
+        pattern = re.compile(r"\A---$(.+?)^---$", re.MULTILINE | re.DOTALL)
+        cases = [
+            "---\ntitle: T\n---\n\nText\n",
+            "---\ntitle: T\n---",
+            "---\n---\nText",
+            "---\n----\na: 1\n---x\n---\nText",
+            "---\na: 1\n",
+            "---\r\na: 1\r\n---\r\n",
+            "----\na: 1\n---\n",
+            "Text\n---\na: 1\n---\n",
+            "---",
+            "",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                match = pattern.search(text)
+                expected = (match.group(1), text[: match.start()] + text[match.end() :]) if match else (None, text)
+                self.assertEqual(extract_frontmatter_block(text), expected)
+
+    def test_read_after_rewrite(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "document.md"
+            path.write_text("---\ntitle: First\n---\n\nText\n", encoding="utf-8")
+            self.assertEqual(Scanner().read(path).title, "First")
+
+            # same size and (within timestamp resolution) same modification time
+            path.write_text("---\ntitle: Other\n---\n\nText\n", encoding="utf-8")
+            self.assertEqual(Scanner().read(path).title, "Other")
+
     def test_mermaid_frontmatter(self) -> None:
         properties = MermaidScanner().read(mermaid_frontmatter)
         if properties.config is None:
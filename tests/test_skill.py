@@ -26,31 +26,36 @@ class TestGenerateSkill(TypedTestCase):
 
     tmp_dir: str
     out_dir: Path
-
-    def setUp(self) -> None:
-        self.tmp_dir = tempfile.mkdtemp()
-        self.out_dir = Path(self.tmp_dir)
-
-    def tearDown(self) -> None:
-        shutil.rmtree(self.tmp_dir)
+    result: Path
+    skill_md_text: str
+    cli_ref_text: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # output depends only on the package version and the argument parser, so it is generated once for all tests
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.out_dir = Path(cls.tmp_dir)
+        cls.result = generate_skill(cls.out_dir)
+        cls.skill_md_text = (cls.out_dir / "md2conf" / "SKILL.md").read_text(encoding="utf-8")
+        cls.cli_ref_text = (cls.out_dir / "md2conf" / "references" / "cli-help.md").read_text(encoding="utf-8")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmp_dir)
 
     def test_creates_skill_directory(self) -> None:
         """generate_skill should create an md2conf/ subdirectory."""
-        result = generate_skill(self.out_dir)
-        self.assertTrue(result.is_dir())
-        self.assertEqual(result.name, "md2conf")
+        self.assertTrue(self.result.is_dir())
+        self.assertEqual(self.result.name, "md2conf")
 
     def test_creates_skill_md(self) -> None:
         """generate_skill should create md2conf/SKILL.md."""
-        generate_skill(self.out_dir)
         skill_md = self.out_dir / "md2conf" / "SKILL.md"
         self.assertTrue(skill_md.is_file())
 
     def test_skill_md_has_frontmatter(self) -> None:
         """SKILL.md should contain valid YAML frontmatter with required fields."""
-        generate_skill(self.out_dir)
-        skill_md = self.out_dir / "md2conf" / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = self.skill_md_text
 
         self.assertIn("name: md2conf", content)
         self.assertIn("description:", content)
@@ -60,9 +65,7 @@ class TestGenerateSkill(TypedTestCase):
 
     def test_skill_md_has_body(self) -> None:
         """SKILL.md should contain documentation body content."""
-        generate_skill(self.out_dir)
-        skill_md = self.out_dir / "md2conf" / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = self.skill_md_text
 
         self.assertIn("# md2conf", content)
         self.assertIn("python3 -m md2conf", content)
@@ -71,15 +74,12 @@ class TestGenerateSkill(TypedTestCase):
 
     def test_creates_cli_reference(self) -> None:
         """generate_skill should create md2conf/references/cli-help.md."""
-        generate_skill(self.out_dir)
         cli_ref = self.out_dir / "md2conf" / "references" / "cli-help.md"
         self.assertTrue(cli_ref.is_file())
 
     def test_cli_reference_has_help_text(self) -> None:
         """cli-help.md should contain the actual CLI help output."""
-        generate_skill(self.out_dir)
-        cli_ref = self.out_dir / "md2conf" / "references" / "cli-help.md"
-        content = cli_ref.read_text(encoding="utf-8")
+        content = self.cli_ref_text
 
         self.assertIn("# md2conf CLI Reference", content)
         self.assertIn("--local", content)
@@ -88,9 +88,7 @@ class TestGenerateSkill(TypedTestCase):
 
     def test_frontmatter_delimiters(self) -> None:
         """SKILL.md frontmatter should be properly delimited with --- markers."""
-        generate_skill(self.out_dir)
-        skill_md = self.out_dir / "md2conf" / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = self.skill_md_text
 
         self.assertTrue(content.startswith("---\n"))
         # Should have closing --- delimiter
@@ -99,26 +97,24 @@ class TestGenerateSkill(TypedTestCase):
 
     def test_idempotent(self) -> None:
         """Running generate_skill twice should produce the same output without errors."""
-        generate_skill(self.out_dir)
-        generate_skill(self.out_dir)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_dir = Path(tmp_dir)
+            generate_skill(out_dir)
+            generate_skill(out_dir)
 
-        skill_md = self.out_dir / "md2conf" / "SKILL.md"
-        self.assertTrue(skill_md.is_file())
+            skill_md = out_dir / "md2conf" / "SKILL.md"
+            self.assertTrue(skill_md.is_file())
+            self.assertEqual(skill_md.read_text(encoding="utf-8"), self.skill_md_text)
 
     def test_returns_skill_dir_path(self) -> None:
         """generate_skill should return the path to the skill directory."""
-        result = generate_skill(self.out_dir)
-        self.assertEqual(result, self.out_dir / "md2conf")
+        self.assertEqual(self.result, self.out_dir / "md2conf")
 
     def test_version_in_frontmatter(self) -> None:
         """SKILL.md frontmatter should include the package version."""
         from md2conf import __version__
 
-        generate_skill(self.out_dir)
-        skill_md = self.out_dir / "md2conf" / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
-
-        self.assertIn(__version__, content)
+        self.assertIn(__version__, self.skill_md_text)
 
 
 if __name__ == "__main__":
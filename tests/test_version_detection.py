@@ -7,10 +7,18 @@ Copyright 2022-2025, Levente Hunyadi
 """
 
 import unittest
+from typing import Optional
 
 from md2conf.api import ConfluenceVersion
 from md2conf.environment import ConfluenceConnectionProperties
-from tests.utility import TypedTestCase
+from tests.utility import TypedTestCase, make_session
+
+_DEPLOYMENT_TO_VERSION: dict[Optional[str], ConfluenceVersion] = {
+    "datacenter": ConfluenceVersion.VERSION_1,
+    "server": ConfluenceVersion.VERSION_1,
+    "cloud": ConfluenceVersion.VERSION_2,
+    None: ConfluenceVersion.VERSION_2,
+}
 
 
 class TestVersionDetection(TypedTestCase):
@@ -47,54 +55,12 @@ class TestVersionDetection(TypedTestCase):
         # When deployment_type is not specified, it defaults to "cloud"
         self.assertIsNone(props.deployment_type)
 
-    def test_version_detection_logic_datacenter(self) -> None:
-        """Test version detection logic for datacenter deployment type."""
-        # Test the logic directly without instantiating ConfluenceSession
-        deployment_type = "datacenter"
-        if deployment_type in ("datacenter", "server"):
-            version = ConfluenceVersion.VERSION_1
-        elif deployment_type == "cloud":
-            version = ConfluenceVersion.VERSION_2
-        else:
-            version = ConfluenceVersion.VERSION_2
-
-        self.assertEqual(version, ConfluenceVersion.VERSION_1)
-
-    def test_version_detection_logic_server(self) -> None:
-        """Test version detection logic for server deployment type."""
-        deployment_type = "server"
-        if deployment_type in ("datacenter", "server"):
-            version = ConfluenceVersion.VERSION_1
-        elif deployment_type == "cloud":
-            version = ConfluenceVersion.VERSION_2
-        else:
-            version = ConfluenceVersion.VERSION_2
-
-        self.assertEqual(version, ConfluenceVersion.VERSION_1)
-
-    def test_version_detection_logic_cloud(self) -> None:
-        """Test version detection logic for cloud deployment type."""
-        deployment_type = "cloud"
-        if deployment_type in ("datacenter", "server"):
-            version = ConfluenceVersion.VERSION_1
-        elif deployment_type == "cloud":
-            version = ConfluenceVersion.VERSION_2
-        else:
-            version = ConfluenceVersion.VERSION_2
-
-        self.assertEqual(version, ConfluenceVersion.VERSION_2)
-
-    def test_version_detection_logic_none(self) -> None:
-        """Test version detection logic when deployment_type is None (defaults to v2)."""
-        deployment_type = None
-        if deployment_type in ("datacenter", "server"):
-            version = ConfluenceVersion.VERSION_1
-        elif deployment_type == "cloud":
-            version = ConfluenceVersion.VERSION_2
-        else:
-            version = ConfluenceVersion.VERSION_2
-
-        self.assertEqual(version, ConfluenceVersion.VERSION_2)
+    def test_version_detection_logic(self) -> None:
+        """Test version detection logic for each deployment type, defaulting to v2 when unspecified."""
+        session = make_session("cloud")
+        for deployment_type, expected in _DEPLOYMENT_TO_VERSION.items():
+            with self.subTest(deployment_type=deployment_type):
+                self.assertIs(session._detect_api_version(deployment_type), expected)
 
     def test_version_enum_values(self) -> None:
         """Test that ConfluenceVersion enum has expected values."""
@@ -8,7 +8,7 @@ Copyright 2022-2025, Levente Hunyadi
 
 import unittest
 from collections.abc import Container, Iterable
-from typing import Optional, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 from unittest.mock import Mock
 from unittest.util import safe_repr
 
@@ -71,3 +71,28 @@ def make_session(deployment_type: str) -> ConfluenceSession:
         base_path="/wiki/",
         space_key="TEST",
     )
+
+
+def json_response(payload: Any) -> Mock:
+    """
+    Builds a successful mocked HTTP response whose body decodes to the given JSON payload.
+    """
+
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.text = ""
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+def empty_response() -> Mock:
+    """
+    Builds a successful mocked HTTP response with no content.
+    """
+
+    response = Mock(spec=requests.Response)
+    response.status_code = 204
+    response.text = ""
+    response.raise_for_status.return_value = None
+    return response